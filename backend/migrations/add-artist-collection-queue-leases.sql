@@ -0,0 +1,11 @@
+-- 아티스트 수집 대기열: 분산 워커용 리스(lease) 컬럼
+-- wikipediaArtistCollector.py --worker 가 SELECT ... FOR UPDATE SKIP LOCKED 로 작업을 가져가고
+-- 처리하는 동안 lease_expires_at 을 주기적으로 연장한다. 리스가 만료된 작업은 다른 워커가 다시 가져간다.
+ALTER TABLE artist_collection_queue ADD COLUMN IF NOT EXISTS lease_expires_at TIMESTAMPTZ;
+ALTER TABLE artist_collection_queue ADD COLUMN IF NOT EXISTS heartbeat_at TIMESTAMPTZ;
+
+-- 인덱스
+CREATE INDEX IF NOT EXISTS idx_artist_collection_queue_lease ON artist_collection_queue(lease_expires_at) WHERE status = 'processing';
+
+COMMENT ON COLUMN artist_collection_queue.lease_expires_at IS '워커 리스 만료 시각 (하트비트로 연장, 만료 시 재할당)';
+COMMENT ON COLUMN artist_collection_queue.heartbeat_at IS '워커의 마지막 하트비트 시각';
@@ -5,38 +5,67 @@ Python Wikipedia-API를 활용한 정밀한 아티스트 데이터 수집
 
 설치 방법:
 pip install wikipedia-api requests psycopg2-binary openai
+(psycopg2/openai/wikipedia-api는 필요한 경로에서만 로드되므로 --help, --no-db 실행에는 필요 없는 의존성도 있음)
 
 사용법:
 python wikipediaArtistCollector.py --artist "Pablo Picasso"
 python wikipediaArtistCollector.py --batch artists_list.txt
+python wikipediaArtistCollector.py --batch artists_list.txt --max-concurrency 12
+python wikipediaArtistCollector.py --artist "Pablo Picasso" --no-db --ndjson artists.ndjson
+python wikipediaArtistCollector.py --batch artists_list.txt --download-portraits ./portraits
+python wikipediaArtistCollector.py --backfill --backfill-limit 1000
+python wikipediaArtistCollector.py --batch artists_list.txt --redirect-dump enwiki-redirects.tsv
+python wikipediaArtistCollector.py --recompute-classification --dry-run
+python wikipediaArtistCollector.py --batch artists_list.txt --time-budget 600 --request-budget 5000
+
+분산 수집 (Postgres 대기열, 여러 호스트/프로세스에서 워커 실행 가능):
+python wikipediaArtistCollector.py --enqueue artists_list.txt
+python wikipediaArtistCollector.py --worker
 """
 
-import wikipediaapi
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import re
 import sys
+import hashlib
+import heapq
+import math
+import unicodedata
+import time
+import socket
+import threading
 import argparse
 import logging
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from datetime import datetime
+from email.utils import parsedate_to_datetime
 from typing import Dict, List, Optional, Any
-import psycopg2
-from psycopg2.extras import RealDictCursor
-import openai
+from urllib.parse import urlparse
 import os
-from dataclasses import dataclass
-
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('artist_collection.log'),
-        logging.StreamHandler()
-    ]
-)
+from dataclasses import asdict, dataclass, replace
+
+# 무거운 의존성(wikipediaapi, psycopg2, openai)은 사용하는 경로에서 지연 로딩
 logger = logging.getLogger(__name__)
 
+def configure_logging():
+    """로깅 설정 (import 시점이 아닌 main()에서 호출)"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler('artist_collection.log'),
+            logging.StreamHandler()
+        ]
+    )
+
+def connect_database(db_config: Dict[str, Any]):
+    """psycopg2를 지연 로딩하여 RealDictCursor 기본 연결 생성"""
+    import psycopg2
+    from psycopg2.extras import RealDictCursor
+    return psycopg2.connect(cursor_factory=RealDictCursor, **db_config)
+
 @dataclass
 class ArtistInfo:
     """아티스트 정보 데이터 클래스"""
@@ -60,31 +89,795 @@ class ArtistInfo:
     influenced: Optional[List[str]] = None
     spouse: Optional[str] = None
     image_url: Optional[str] = None
+    original_image_url: Optional[str] = None
     wikipedia_url: Optional[str] = None
     wikidata_id: Optional[str] = None
     categories: Optional[List[str]] = None
     references: Optional[List[str]] = None
+    image_key: Optional[str] = None
+    image_variants: Optional[Dict[str, str]] = None
+
+class NdjsonArtistWriter:
+    """수집된 ArtistInfo를 DB 대신 NDJSON 파일로 기록 (--no-db)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'w', encoding='utf-8')
+        self._lock = threading.Lock()
+
+    def write(self, artist_info: ArtistInfo) -> bool:
+        line = json.dumps(asdict(artist_info), ensure_ascii=False)
+        with self._lock:
+            self._file.write(line + '\n')
+            self._file.flush()
+        return True
+
+    def close(self):
+        self._file.close()
+
+# 업스트림이 속도 제한을 걸 때 돌려주는 상태 코드
+THROTTLE_STATUS_CODES = (429, 503)
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 시간(초)으로 변환"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, retry_at.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+class HostConcurrencyLimit:
+    """
+    호스트별 동시 요청 한도 (AIMD + 지연시간 기울기)
+
+    성공 응답마다 한도를 1/limit 씩 늘려 RTT당 약 +1 증가시키고,
+    429/503 응답이나 단기 평균 지연시간이 기준치의 latency_tolerance 배를 넘으면
+    한도를 곱셈으로 줄인다. Retry-After 동안은 새 요청을 보내지 않는다.
+    기준치는 최근 약 baseline_window 개 응답의 장기 평균이라 한 번의 빠른 응답이나
+    같은 호스트의 빠른/느린 엔드포인트가 섞여도 한도가 바닥에 고정되지 않는다.
+    """
+
+    def __init__(self, host: str, initial: float = 2, minimum: float = 1,
+                 maximum: float = 8, latency_tolerance: float = 2.0, baseline_window: int = 100):
+        self.host = host
+        self.limit = float(initial)
+        self.min_limit = float(minimum)
+        self.max_limit = float(maximum)
+        self.peak_limit = self.limit
+        self.latency_tolerance = latency_tolerance
+        self.baseline_window = baseline_window
+        self.in_flight = 0
+        self.blocked_until = 0.0
+        self.last_decrease = 0.0
+        self.baseline_latency: Optional[float] = None
+        self.ewma_latency: Optional[float] = None
+        self.requests = 0
+        self.throttled = 0
+        self.retry_after_waits = 0
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        """한도와 Retry-After 대기가 허락할 때까지 블록"""
+        with self._cond:
+            while True:
+                wait = self.blocked_until - time.monotonic()
+                if wait <= 0 and self.in_flight < int(self.limit):
+                    break
+                self._cond.wait(timeout=wait if wait > 0 else None)
+            self.in_flight += 1
+
+    def release(self, latency: float, status: Optional[int], retry_after: Optional[float] = None):
+        """응답 결과를 반영해 한도 조정"""
+        with self._cond:
+            self.in_flight -= 1
+            self.requests += 1
+            now = time.monotonic()
+
+            if status in THROTTLE_STATUS_CODES:
+                self.throttled += 1
+                if retry_after:
+                    self.retry_after_waits += 1
+                    self.blocked_until = max(self.blocked_until, now + retry_after)
+                self._decrease(now, 0.5)
+            elif status is not None and status < 500:
+                self.ewma_latency = latency if self.ewma_latency is None else 0.8 * self.ewma_latency + 0.2 * latency
+                if self.baseline_latency is None:
+                    self.baseline_latency = latency
+                else:
+                    self.baseline_latency += (latency - self.baseline_latency) / self.baseline_window
+
+                if self.ewma_latency > self.baseline_latency * self.latency_tolerance:
+                    # 큐가 쌓이기 시작한 신호 → 완만하게 감소
+                    self._decrease(now, 0.9)
+                elif self.in_flight + 1 >= self.limit / 2:
+                    # 한도를 실제로 사용 중일 때만 증가 (유휴 상태에서 한도가 부풀지 않도록)
+                    self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+                    self.peak_limit = max(self.peak_limit, self.limit)
+            else:
+                # 네트워크 오류/5xx: 증가하지 않고 한 단계 감소
+                self._decrease(now, 0.75)
+
+            self._cond.notify_all()
+
+    def _decrease(self, now: float, factor: float):
+        # 같은 RTT 안의 연속된 신호는 한 번만 반영 (한도가 바닥까지 떨어지는 것 방지)
+        if now - self.last_decrease < (self.ewma_latency or 1.0):
+            return
+        self.limit = max(self.min_limit, self.limit * factor)
+        self.last_decrease = now
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                'limit': round(self.limit, 2),
+                'peak_limit': round(self.peak_limit, 2),
+                'requests': self.requests,
+                'throttled': self.throttled,
+                'retry_after_waits': self.retry_after_waits,
+                'avg_latency_ms': round(self.ewma_latency * 1000) if self.ewma_latency else None
+            }
+
+class AdaptiveConcurrencyController:
+    """호스트별 HostConcurrencyLimit 관리"""
+
+    def __init__(self, initial: float = 2, maximum: float = 8):
+        self.initial = initial
+        self.maximum = maximum
+        self._limits: Dict[str, HostConcurrencyLimit] = {}
+        self._lock = threading.Lock()
+
+    def limit_for(self, host: str) -> HostConcurrencyLimit:
+        with self._lock:
+            if host not in self._limits:
+                self._limits[host] = HostConcurrencyLimit(
+                    host, initial=min(self.initial, self.maximum), maximum=self.maximum
+                )
+            return self._limits[host]
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            limits = list(self._limits.values())
+        return {limit.host: limit.snapshot() for limit in limits}
+
+    def total_requests(self) -> int:
+        """모든 호스트에 보낸 요청 수 (재시도 포함)"""
+        with self._lock:
+            limits = list(self._limits.values())
+        return sum(limit.requests for limit in limits)
+
+class AdaptiveHTTPAdapter(HTTPAdapter):
+    """모든 요청을 호스트별 동시성 한도로 감싸는 requests 어댑터"""
+
+    def __init__(self, controller: AdaptiveConcurrencyController, throttle_retries: int = 3, **kwargs):
+        super().__init__(**kwargs)
+        self.controller = controller
+        self.throttle_retries = throttle_retries
+
+    def send(self, request, **kwargs):
+        limit = self.controller.limit_for(urlparse(request.url).netloc)
+
+        for attempt in range(self.throttle_retries + 1):
+            limit.acquire()
+            started = time.monotonic()
+            try:
+                response = super().send(request, **kwargs)
+            except Exception:
+                limit.release(time.monotonic() - started, None)
+                raise
+
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            limit.release(time.monotonic() - started, response.status_code, retry_after)
+
+            if response.status_code not in THROTTLE_STATUS_CODES or attempt == self.throttle_retries:
+                return response
+
+            logger.warning(f"⏳ {limit.host} 속도 제한 ({response.status_code}), 재시도 {attempt + 1}/{self.throttle_retries}")
+            response.close()
+            if retry_after is None:
+                # Retry-After가 없으면 지수 백오프 (있으면 acquire()에서 대기)
+                time.sleep(min(2 ** attempt, 30))
+
+        return response
+
+class PortraitStore:
+    """
+    초상화 로컬 저장소 (콘텐츠 주소 기반)
+
+    파일은 SHA-256 해시 경로(ab/cd/<hash>.jpg)에 저장되어 같은 이미지는 한 번만 기록된다.
+    원본 이미지(originalimage)가 있으면 썸네일 대신 원본을 받아 변형본을 만든다.
+    다운로드는 .part 파일에 이어받기(Range + If-Range)로 기록되며, 리사이즈 변형본은 Pillow가
+    설치된 경우에만 미리 생성한다. URL → 키 매핑은 manifest.json 에 보관한다.
+    새 매핑은 manifest.log 에 한 줄씩 덧붙이고 save_manifest() 에서 manifest.json 으로 합친다
+    (저장할 때마다 전체 매니페스트를 다시 쓰지 않음).
+    """
+
+    # 변형본 이름 → 최대 변 길이(px)
+    VARIANTS = {'thumb': 128, 'medium': 256}
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, root: str, session, max_workers: int = 4):
+        self.root = root
+        self.session = session
+        self.max_workers = max_workers
+        self.partial_dir = os.path.join(root, '.partial')
+        self.manifest_path = os.path.join(root, 'manifest.json')
+        self.manifest_log_path = os.path.join(root, 'manifest.log')
+        os.makedirs(self.partial_dir, exist_ok=True)
+
+        self.manifest: Dict[str, Dict[str, Any]] = {}
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                self.manifest = json.load(f)
+        if os.path.exists(self.manifest_log_path):
+            # 이전 실행이 합치지 못한 매핑 (중단된 경우 마지막 줄은 잘려 있을 수 있음)
+            with open(self.manifest_log_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    self.manifest[record.pop('url')] = record
+        self._lock = threading.Lock()
+        # 같은 URL을 여러 스레드가 동시에 요청해도 .part 파일에는 한 곳에서만 기록
+        self._flights = SingleFlight()
+        self._pillow_warned = False
+
+    @staticmethod
+    def download_url(artist_info: ArtistInfo) -> Optional[str]:
+        return artist_info.original_image_url or artist_info.image_url
+
+    def store_portraits(self, artist_infos: List[ArtistInfo]) -> int:
+        """초상화를 병렬로 내려받아 image_key/image_variants 설정 → 저장된 수"""
+        # 같은 이미지를 공유하는 아티스트(별칭, 같은 문서로 합쳐진 검색)는 한 번만 내려받음
+        targets: Dict[str, List[ArtistInfo]] = {}
+        for info in artist_infos:
+            url = self.download_url(info)
+            if url:
+                targets.setdefault(url, []).append(info)
+        if not targets:
+            return 0
+
+        stored = 0
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(self.fetch, url): url for url in targets}
+            for future in as_completed(futures):
+                infos = targets[futures[future]]
+                try:
+                    entry = future.result()
+                except Exception as e:
+                    logger.warning(f"초상화 다운로드 실패 ({infos[0].name}): {e}")
+                    continue
+                if entry:
+                    for info in infos:
+                        info.image_key = entry['key']
+                        info.image_variants = entry['variants'] or None
+                    stored += len(infos)
+
+        self._flights.clear()
+        return stored
+
+    def fetch(self, url: str) -> Optional[Dict[str, Any]]:
+        """URL의 이미지를 저장소에 기록하고 {'key', 'variants'} 반환 (동시 요청은 하나로 합침)"""
+        return self._flights.do(url, lambda: self._fetch(url))
+
+    def _fetch(self, url: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self.manifest.get(url)
+        if entry and os.path.exists(os.path.join(self.root, entry['key'])):
+            return entry
+
+        part_path = os.path.join(self.partial_dir, hashlib.sha1(url.encode('utf-8')).hexdigest() + '.part')
+        content_type = self._download(url, part_path)
+        if content_type is None:
+            return None
+
+        digest = hashlib.sha256()
+        with open(part_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(self.CHUNK_SIZE), b''):
+                digest.update(chunk)
+        content_hash = digest.hexdigest()
+
+        ext = self._extension(url, content_type)
+        key = f"{content_hash[:2]}/{content_hash[2:4]}/{content_hash}{ext}"
+        path = os.path.join(self.root, key)
+        if os.path.exists(path):
+            # 이미 같은 내용이 저장되어 있음 (다른 URL/아티스트와 중복)
+            os.remove(part_path)
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(part_path, path)
+        self._remove_meta(part_path)
+
+        entry = {'key': key, 'variants': self._make_variants(path, key)}
+        with self._lock:
+            self.manifest[url] = entry
+            with open(self.manifest_log_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({'url': url, **entry}, ensure_ascii=False) + '\n')
+        return entry
+
+    def _download(self, url: str, part_path: str, resume: bool = True) -> Optional[str]:
+        """
+        이어받기 지원 다운로드 → Content-Type (실패/미완료 시 None)
+
+        이어받기는 처음 응답의 ETag/Last-Modified 를 If-Range 로 보내 같은 파일 버전일 때만 한다.
+        썸네일 URL은 파일이 새 버전으로 바뀌어도 그대로라 검증 없이 이어 붙이면 두 버전이 섞인다.
+        """
+        meta_path = part_path + '.json'
+        meta = {}
+        if resume and os.path.exists(part_path) and os.path.exists(meta_path):
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        validator = meta.get('etag') or meta.get('last_modified')
+        offset = os.path.getsize(part_path) if validator else 0
+        headers = {'Range': f'bytes={offset}-', 'If-Range': validator} if offset else {}
+
+        with self.session.get(url, headers=headers, stream=True, timeout=30) as response:
+            if response.status_code == 416:
+                # 요청한 위치가 파일 끝: 크기가 맞을 때만 이미 전부 받은 것으로 인정
+                total = self._content_range_total(response.headers.get('Content-Range'))
+                if offset and total == offset:
+                    return meta.get('content_type', '')
+                self._discard(part_path)
+                return self._download(url, part_path, resume=False) if resume else None
+            if response.status_code not in (200, 206):
+                logger.warning(f"초상화 다운로드 실패 ({response.status_code}): {url}")
+                return None
+
+            if response.status_code == 206:
+                # 요청한 위치부터 온 조각만 이어 붙임
+                start = self._content_range_start(response.headers.get('Content-Range'))
+                if not offset or start != offset:
+                    response.close()
+                    self._discard(part_path)
+                    return self._download(url, part_path, resume=False) if resume else None
+                total = self._content_range_total(response.headers.get('Content-Range'))
+                mode = 'ab'
+            else:
+                # Range를 무시했거나 If-Range 검증 실패(다른 버전) → 처음부터 다시 기록
+                length = response.headers.get('Content-Length')
+                encoded = response.headers.get('Content-Encoding')
+                total = int(length) if length and length.isdigit() and not encoded else None
+                meta = {
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                    'content_type': response.headers.get('Content-Type', '')
+                }
+                with open(meta_path, 'w', encoding='utf-8') as f:
+                    json.dump(meta, f)
+                mode = 'wb'
+
+            with open(part_path, mode) as f:
+                for chunk in response.iter_content(self.CHUNK_SIZE):
+                    f.write(chunk)
+
+        size = os.path.getsize(part_path)
+        if total is not None and size != total:
+            # 연결이 중간에 끊김: 다음 실행에서 이어받기
+            logger.warning(f"초상화 다운로드 미완료 ({size}/{total} bytes): {url}")
+            return None
+        return meta.get('content_type', '')
+
+    @staticmethod
+    def _content_range_start(value: Optional[str]) -> Optional[int]:
+        match = re.match(r'bytes (\d+)-\d+/', value or '')
+        return int(match.group(1)) if match else None
+
+    @staticmethod
+    def _content_range_total(value: Optional[str]) -> Optional[int]:
+        match = re.match(r'bytes (?:\d+-\d+|\*)/(\d+)', value or '')
+        return int(match.group(1)) if match else None
+
+    def _discard(self, part_path: str):
+        if os.path.exists(part_path):
+            os.remove(part_path)
+        self._remove_meta(part_path)
+
+    @staticmethod
+    def _remove_meta(part_path: str):
+        if os.path.exists(part_path + '.json'):
+            os.remove(part_path + '.json')
+
+    def _make_variants(self, path: str, key: str) -> Dict[str, str]:
+        """리사이즈 변형본 생성 (Pillow 선택 의존성)"""
+        try:
+            from PIL import Image
+        except ImportError:
+            if not self._pillow_warned:
+                logger.warning("Pillow가 설치되지 않아 초상화 변형본 생성을 건너뜀 (pip install Pillow)")
+                self._pillow_warned = True
+            return {}
+
+        base, ext = os.path.splitext(key)
+        variants = {}
+        try:
+            with Image.open(path) as image:
+                for name, size in self.VARIANTS.items():
+                    variant_key = f"{base}_{name}{ext}"
+                    variant_path = os.path.join(self.root, variant_key)
+                    if not os.path.exists(variant_path):
+                        variant = image.copy()
+                        variant.thumbnail((size, size))
+                        variant.save(variant_path)
+                    variants[name] = variant_key
+        except Exception as e:
+            logger.warning(f"초상화 변형본 생성 실패 ({key}): {e}")
+        return variants
+
+    @staticmethod
+    def _extension(url: str, content_type: str) -> str:
+        content_type = (content_type or '').split(';')[0].strip().lower()
+        known = {'image/jpeg': '.jpg', 'image/png': '.png', 'image/gif': '.gif',
+                 'image/webp': '.webp', 'image/svg+xml': '.svg'}
+        if content_type in known:
+            return known[content_type]
+        ext = os.path.splitext(urlparse(url).path)[1].lower()
+        return ext if ext in known.values() or ext == '.jpeg' else '.bin'
+
+    def save_manifest(self):
+        """manifest.log 를 manifest.json 으로 합침 (실행 종료 시 한 번)"""
+        with self._lock:
+            tmp_path = self.manifest_path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.manifest, f, ensure_ascii=False)
+            os.replace(tmp_path, self.manifest_path)
+            if os.path.exists(self.manifest_log_path):
+                os.remove(self.manifest_log_path)
+
+class SingleFlight:
+    """
+    같은 키에 대한 호출을 하나로 합치는 헬퍼
+
+    먼저 들어온 호출만 실제로 실행하고, 동시에 들어온 호출은 그 결과를 기다린다.
+    결과는 clear() 전까지 보관되어 같은 실행 안에서 중복 HTTP 요청이 생기지 않는다.
+    """
+
+    class _Call:
+        def __init__(self):
+            self.done = threading.Event()
+            self.result = None
+            self.error: Optional[BaseException] = None
+
+    def __init__(self):
+        self._calls: Dict[Any, 'SingleFlight._Call'] = {}
+        self._lock = threading.Lock()
+        self.coalesced = 0
+
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = self._Call()
+            else:
+                self.coalesced += 1
+
+        if leader:
+            try:
+                call.result = fn()
+            except BaseException as e:
+                call.error = e
+            finally:
+                call.done.set()
+        else:
+            call.done.wait()
+
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def clear(self):
+        with self._lock:
+            self._calls = {key: call for key, call in self._calls.items() if not call.done.is_set()}
+
+class ArtistNameResolver:
+    """
+    로컬 아티스트 이름 → Wikipedia 문서 제목 해석기 (트라이그램 유사도)
+
+    기존 artists 이름, 이전 실행에서 해석된 제목(캐시 파일), 선택적 리다이렉트 덤프
+    ("별칭<TAB>제목" 또는 제목 한 줄)로 메모리 색인을 만든다. 점수가 threshold 이상이면
+    네트워크 검색(search_variations) 없이 제목을 돌려준다.
+    색인은 추가만 되므로(리스트 append) 조회는 잠금 없이 하고, 쓰기끼리만 _lock 으로 직렬화한다.
+    """
+
+    # 필수 접두 트라이그램 이후 추가로 셀 색인 항목 수 상한 (흔한 트라이그램은 세지 않음)
+    SCAN_BUDGET = 1000
+
+    def __init__(self, threshold: float = 0.8, cache_path: Optional[str] = None):
+        self.threshold = threshold
+        self.cache_path = cache_path
+        self._titles: List[str] = []
+        self._keys: List[str] = []
+        self._exact: Dict[str, int] = {}
+        self._grams: List[int] = []
+        self._postings: Dict[str, List[int]] = {}
+        self._learned: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+        if cache_path and os.path.exists(cache_path):
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                for name, title in json.load(f).items():
+                    self.learn(name, title)
+
+    @staticmethod
+    def normalize(name: str, punctuation: str = ' ') -> str:
+        """악센트/구두점 제거, 소문자, 공백 정리 (구두점은 punctuation 으로 치환)"""
+        decomposed = unicodedata.normalize('NFKD', name)
+        stripped = ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+        return ' '.join(re.sub(r'[^\w\s]', punctuation, stripped.lower()).split())
+
+    @staticmethod
+    def trigrams(key: str) -> set:
+        padded = f"  {key} "
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    def add(self, name: str, title: str):
+        """별칭(name) → 제목 등록"""
+        key = self.normalize(name)
+        if not key:
+            return
+        with self._lock:
+            if key in self._exact:
+                return
+            grams = self.trigrams(key)
+            index = len(self._titles)
+            # 잠금 없는 조회가 반쯤 추가된 항목을 보지 않도록 항목 → 색인 순으로 기록
+            self._titles.append(title)
+            self._keys.append(key)
+            self._grams.append(len(grams))
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(index)
+            self._exact[key] = index
+
+    def learn(self, name: str, title: str):
+        """해석 결과 기록 (캐시 파일에 보존)"""
+        self.add(name, title)
+        self.add(title, title)
+        with self._lock:
+            self._learned[name] = title
+
+    def load_artist_names(self, rows):
+        """artists 행(name, name_ko) 등록"""
+        for row in rows:
+            self.add(row['name'], row['name'])
+            if row.get('name_ko'):
+                self.add(row['name_ko'], row['name'])
+
+    def load_redirect_dump(self, path: str) -> int:
+        """리다이렉트 덤프 등록 → 줄 수"""
+        count = 0
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                parts = line.rstrip('\n').split('\t')
+                if not parts[0]:
+                    continue
+                title = parts[-1].replace('_', ' ')
+                self.add(parts[0].replace('_', ' '), title)
+                count += 1
+        return count
+
+    def lookup(self, name: str, min_score: Optional[float] = None) -> Optional[tuple]:
+        """
+        가장 유사한 (제목, 점수) — 점수는 트라이그램 Dice 계수, min_score(기본 threshold) 미만이면 None
+
+        Dice ≥ t 인 항목은 트라이그램 수가 a·t/(2-t) ~ a·(2-t)/t 범위이고 질의의 트라이그램을
+        적어도 ceil(a·t/(2-t)) 개 공유한다. 그래서 가장 드문 트라이그램 a - ceil(a·t/(2-t)) + 1 개의
+        색인만 훑어 후보를 모으고(prefix filter) 길이로 거른 뒤 실제 점수를 계산한다.
+        """
+        key = self.normalize(name)
+        if not key:
+            return None
+        index = self._exact.get(key)
+        if index is not None:
+            return self._titles[index], 1.0
+        
+        threshold = self.threshold if min_score is None else min_score
+        grams = self.trigrams(key)
+        size = len(grams)
+        if threshold > 0:
+            # 경계값(점수가 정확히 threshold)이 부동소수 오차로 걸러지지 않도록 여유를 둠
+            min_overlap = max(1, math.ceil(size * threshold / (2 - threshold) - 1e-9))
+            min_size = size * threshold / (2 - threshold) - 1e-9
+            max_size = size * (2 - threshold) / threshold + 1e-9
+        else:
+            min_overlap, min_size, max_size = 1, 0, float('inf')
+        
+        # 필수 접두 트라이그램 + 색인이 짧은 트라이그램을 추가로 세어 공유 수 상한으로 후보를 거름
+        rare_first = sorted(grams, key=lambda gram: len(self._postings.get(gram, ())))
+        required = size - min_overlap + 1
+        counted = scanned = 0
+        shared = Counter()
+        for gram in rare_first:
+            postings = self._postings.get(gram, ())
+            if counted >= required and scanned + len(postings) > self.SCAN_BUDGET:
+                break
+            counted += 1
+            scanned += len(postings)
+            shared.update(postings)
+        unscanned = size - counted
+        # 세지 않은 트라이그램을 모두 공유해도 가장 짧은 후보조차 기준 미달인 공유 수
+        min_count = threshold * (size + min_size) / 2 - unscanned - 1e-9
+        
+        best, best_score = None, threshold
+        for index, count in shared.items():
+            if count < min_count:
+                continue
+            other_size = self._grams[index]
+            if other_size < min_size or other_size > max_size:
+                continue
+            if 2 * (count + unscanned) < threshold * (size + other_size) - 1e-9:
+                continue
+            score = 2 * len(grams & self.trigrams(self._keys[index])) / (size + other_size)
+            if score > best_score or (best is None and score >= best_score):
+                best, best_score = index, score
+        
+        if best is None:
+            return None
+        return self._titles[best], best_score
     
+    def resolve(self, name: str) -> Optional[str]:
+        """threshold 이상일 때만 제목 반환 (아니면 네트워크 검색으로)"""
+        match = self.lookup(name)
+        if match and match[1] >= self.threshold:
+            return match[0]
+        return None
+
+    def save_cache(self):
+        if not self.cache_path:
+            return
+        with self._lock:
+            learned = dict(self._learned)
+        if not learned:
+            return
+        tmp_path = self.cache_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(learned, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.cache_path)
+
+class RunBudget:
+    """
+    실행 예산 (시간 / HTTP 요청 수)
+
+    요청 수는 AdaptiveConcurrencyController 가 센 실제 요청으로 계산한다.
+    예산이 소진되면 스케줄러가 새 작업을 시작하지 않고 남은 작업을 보류(deferred)한다.
+    """
+
+    def __init__(self, controller: AdaptiveConcurrencyController,
+                 time_budget: Optional[float] = None, request_budget: Optional[int] = None):
+        self.controller = controller
+        self.time_budget = time_budget
+        self.request_budget = request_budget
+        self.started = time.monotonic()
+        self.requests_at_start = controller.total_requests()
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    def requests_used(self) -> int:
+        return self.controller.total_requests() - self.requests_at_start
+
+    def exhausted_reason(self, expected_requests: int = 0) -> Optional[str]:
+        """예산이 부족하면 'time_budget' / 'request_budget', 아니면 None"""
+        if self.time_budget is not None and self.elapsed() >= self.time_budget:
+            return 'time_budget'
+        if self.request_budget is not None and self.requests_used() + expected_requests > self.request_budget:
+            return 'request_budget'
+        return None
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            'elapsed_seconds': round(self.elapsed(), 1),
+            'time_budget': self.time_budget,
+            'requests_used': self.requests_used(),
+            'request_budget': self.request_budget
+        }
+
+class BatchScheduler:
+    """
+    비용을 고려한 우선순위 스케줄러
+
+    우선순위 = (1 + 누락 필드 수·missing + is_featured·featured + 경과 일수·staleness) / 예상 요청 수^cost
+    예산(RunBudget)이 부족하면 작업을 보류한다. 시간 예산이 끝나면 남은 작업을 모두 보류하고,
+    요청 예산이 모자라면 진행 중 작업이 끝날 때까지 기다렸다가 다시 판단하며, 진행 중 작업이
+    없는데도 모자라면 그 작업만 보류하고 더 싼 작업을 계속 찾는다.
+    (진행 중 작업의 예상 요청은 실제 요청과 별도로 예약되므로 예산 판단은 보수적이다)
+    """
+
+    DEFAULT_WEIGHTS = {'missing': 1.0, 'featured': 10.0, 'staleness': 0.005, 'cost': 1.0}
+    MAX_STALENESS_DAYS = 365
+
+    def __init__(self, budget: Optional[RunBudget] = None, weights: Optional[Dict[str, float]] = None):
+        self.budget = budget
+        self.weights = {**self.DEFAULT_WEIGHTS, **(weights or {})}
+        self.deferred: List[Dict[str, Any]] = []
+        self._heap = []
+        self._order = 0
+
+    def priority(self, item: Dict[str, Any]) -> float:
+        value = (
+            1
+            + self.weights['missing'] * item['missing_count']
+            + self.weights['featured'] * (1 if item['featured'] else 0)
+            + self.weights['staleness'] * min(item['staleness_days'], self.MAX_STALENESS_DAYS)
+        )
+        return value / max(1, item['cost']) ** self.weights['cost']
+
+    def push(self, item: Dict[str, Any]):
+        item['priority'] = round(self.priority(item), 3)
+        heapq.heappush(self._heap, (-item['priority'], self._order, item))
+        self._order += 1
+
+    def pop(self, reserved_requests: int = 0) -> Optional[Dict[str, Any]]:
+        """다음 작업 (없거나 예산이 소진되면 None)"""
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            item = entry[2]
+            reason = self.budget.exhausted_reason(reserved_requests + item['cost']) if self.budget else None
+            if reason is None:
+                return item
+
+            if reason == 'request_budget' and reserved_requests:
+                # 진행 중 작업이 끝난 뒤 실제 사용량으로 다시 판단
+                heapq.heappush(self._heap, entry)
+                return None
+
+            self.deferred.append({**item, 'reason': reason})
+            if reason == 'time_budget':
+                self.defer_rest(reason)
+        return None
+
+    def defer_rest(self, reason: str):
+        while self._heap:
+            _, _, item = heapq.heappop(self._heap)
+            self.deferred.append({**item, 'reason': reason})
+
 class WikipediaArtistCollector:
     """Wikipedia API를 활용한 정밀 아티스트 정보 수집기"""
     
-    def __init__(self):
-        # Wikipedia API 설정 (다국어 지원)
-        self.wiki_en = wikipediaapi.Wikipedia(
-            language='en',
-            extract_format=wikipediaapi.ExtractFormat.WIKI,
-            user_agent='SAYU-ArtCollector/1.0 (https://sayu.life) Data Collection Bot'
+    # 배치 모드에서 한 번에 저장하는 아티스트 수
+    SAVE_BATCH_SIZE = 25
+    
+    def __init__(self, max_concurrency: int = 8, ndjson_writer: Optional[NdjsonArtistWriter] = None,
+                 resolver: Optional[ArtistNameResolver] = None):
+        # 호스트별 적응형 동시성 제어 (배치 모드의 고정 지연 대체)
+        self.max_concurrency = max_concurrency
+        self.concurrency = AdaptiveConcurrencyController(maximum=max_concurrency)
+        self.http_adapter = AdaptiveHTTPAdapter(
+            self.concurrency, pool_maxsize=max(10, max_concurrency * 2)
         )
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = 'SAYU-ArtCollector/1.0 (https://sayu.life) Data Collection Bot'
+        self.session.mount('https://', self.http_adapter)
+        self.session.mount('http://', self.http_adapter)
+
+        # Wikipedia API 클라이언트 (첫 사용 시 생성, wiki_en/wiki_ko 참고)
+        self._wikis: Dict[str, Any] = {}
+        self._wiki_lock = threading.Lock()
         
-        self.wiki_ko = wikipediaapi.Wikipedia(
-            language='ko',
-            extract_format=wikipediaapi.ExtractFormat.WIKI,
-            user_agent='SAYU-ArtCollector/1.0 (https://sayu.life) Data Collection Bot'
-        )
+        # --no-db 모드에서는 DB 대신 NDJSON으로 기록
+        self.ndjson_writer = ndjson_writer
         
-        # OpenAI 설정
-        if os.getenv('OPENAI_API_KEY'):
-            openai.api_key = os.getenv('OPENAI_API_KEY')
+        # 로컬 이름 해석기 (DB 이름 색인은 첫 조회 시 로드)
+        self.resolver = resolver or ArtistNameResolver()
+        self._resolver_db_loaded = ndjson_writer is not None
+        self._resolver_db_lock = threading.Lock()
+        
+        # 실행 중 같은 문서/요약 요청 중복 제거
+        self.single_flight = SingleFlight()
+        
+        # 배치 스케줄링: 실행 예산(--time-budget/--request-budget)과 우선순위 가중치
+        self.budget: Optional[RunBudget] = None
+        self.priority_weights: Optional[Dict[str, float]] = None
+        
+        # --download-portraits 지정 시 초상화를 로컬 저장소에 내려받음
+        self.portrait_store: Optional[PortraitStore] = None
         
         # 데이터베이스 연결
         self.db_config = {
@@ -118,9 +911,41 @@ class WikipediaArtistCollector:
             'constructivism': '구성주의'
         }
 
-    def search_artist(self, artist_name: str) -> Optional[ArtistInfo]:
+    @property
+    def wiki_en(self):
+        return self._wiki('en')
+
+    @property
+    def wiki_ko(self):
+        return self._wiki('ko')
+
+    def _wiki(self, language: str):
+        """Wikipedia API 클라이언트 지연 생성 (다국어 지원)"""
+        with self._wiki_lock:
+            if language not in self._wikis:
+                import wikipediaapi
+
+                wiki = wikipediaapi.Wikipedia(
+                    language=language,
+                    extract_format=wikipediaapi.ExtractFormat.WIKI,
+                    user_agent='SAYU-ArtCollector/1.0 (https://sayu.life) Data Collection Bot'
+                )
+                
+                # wikipediaapi 내부 세션도 같은 동시성 한도를 공유
+                wiki_session = getattr(wiki, '_session', None)
+                if wiki_session is not None:
+                    wiki_session.mount('https://', self.http_adapter)
+                    wiki_session.mount('http://', self.http_adapter)
+                
+                self._wikis[language] = wiki
+            return self._wikis[language]
+
+    def search_artist(self, artist_name: str, missing: Optional[set] = None) -> Optional[ArtistInfo]:
         """
         아티스트 이름으로 Wikipedia 검색 및 정보 수집
+
+        missing 이 주어지면(백필) 비어 있는 필드(BACKFILL_FIELDS)를 채우는 단계만 실행하고,
+        저장되지 않는 카테고리/참고 문헌 수집은 건너뛴다.
         """
         logger.info(f"🎨 Wikipedia에서 '{artist_name}' 검색 시작")
         
@@ -128,15 +953,45 @@ class WikipediaArtistCollector:
             # 1. 영문 Wikipedia 검색
             en_page = self.wiki_en.page(artist_name)
             
+            resolved_locally = False
             if not en_page.exists():
-                # 검색어 변형 시도
-                search_results = self.search_variations(artist_name)
-                if search_results:
-                    en_page = self.wiki_en.page(search_results[0])
-                else:
+                # 로컬 해석기로 오타/별칭 보정 (신뢰도가 낮으면 네트워크 검색)
+                local_title = self.resolve_locally(artist_name)
+                if local_title and local_title != artist_name:
+                    en_page = self.wiki_en.page(local_title)
+                    resolved_locally = True
+            
+            def collect(page):
+                # 같은 문서는 실행 중 한 번만 수집 (동시 요청도 하나로 합침)
+                key = ('artist', page.title, frozenset(missing) if missing is not None else None)
+                return self.single_flight.do(key, lambda: self._collect_page(artist_name, page, missing))
+            
+            artist_info = collect(en_page) if en_page.exists() else None
+            
+            searched = False
+            if not en_page.exists() or (artist_info is None and resolved_locally):
+                # 검색어 변형 시도 (로컬 해석 결과가 아티스트 문서가 아닌 경우 포함)
+                search_results = [title for title in self.search_variations(artist_name) if title != en_page.title]
+                if not search_results:
                     logger.warning(f"영문 Wikipedia에서 '{artist_name}' 찾을 수 없음")
                     return None
+                en_page = self.wiki_en.page(search_results[0])
+                searched = True
+                artist_info = collect(en_page)
+            
+            if artist_info and searched:
+                # 아티스트 문서로 확인된 검색 결과만 해석 캐시에 기록
+                self.resolver.learn(artist_name, en_page.title)
+            # 호출자마다 별도 객체 (초상화 저장 등에서 수정해도 다른 그룹과 공유되지 않도록)
+            return replace(artist_info) if artist_info else None
             
+        except Exception as e:
+            logger.error(f"❌ '{artist_name}' 정보 수집 실패: {str(e)}")
+            return None
+    
+    def _collect_page(self, artist_name: str, en_page, missing: Optional[set]) -> Optional[ArtistInfo]:
+        """영문 문서에서 아티스트 정보 수집 (search_artist 2~7단계)"""
+        try:
             # 아티스트 여부 확인
             if not self.is_artist_page(en_page):
                 logger.warning(f"'{artist_name}'은(는) 아티스트가 아닌 것으로 판단됨")
@@ -146,23 +1001,28 @@ class WikipediaArtistCollector:
             artist_info = self.extract_basic_info(en_page)
             
             # 3. 한국어 Wikipedia 검색
-            ko_info = self.search_korean_wikipedia(artist_name, artist_info)
-            if ko_info:
-                artist_info = self.merge_korean_info(artist_info, ko_info)
+            if missing is None or 'name_ko' in missing:
+                ko_info = self.search_korean_wikipedia(artist_name, artist_info)
+                if ko_info:
+                    artist_info = self.merge_korean_info(artist_info, ko_info)
             
             # 4. Wikidata 정보 추가
-            wikidata_info = self.fetch_wikidata_info(artist_info.wikidata_id)
-            if wikidata_info:
-                artist_info = self.merge_wikidata_info(artist_info, wikidata_info)
+            if missing is None or 'birth_year' in missing:
+                wikidata_info = self.fetch_wikidata_info(artist_info.wikidata_id)
+                if wikidata_info:
+                    artist_info = self.merge_wikidata_info(artist_info, wikidata_info)
             
             # 5. 이미지 정보 수집
-            artist_info.image_url = self.extract_main_image(en_page)
-            
-            # 6. 카테고리 정보 추출
-            artist_info.categories = self.extract_categories(en_page)
+            if missing is None or 'images' in missing:
+                artist_info.image_url = self.extract_main_image(en_page)
+                artist_info.original_image_url = self.extract_original_image(en_page)
             
-            # 7. 참고 문헌 추출
-            artist_info.references = self.extract_references(en_page)
+            if missing is None:
+                # 6. 카테고리 정보 추출
+                artist_info.categories = self.extract_categories(en_page)
+                
+                # 7. 참고 문헌 추출
+                artist_info.references = self.extract_references(en_page)
             
             logger.info(f"✅ '{artist_name}' 정보 수집 완료")
             return artist_info
@@ -354,10 +1214,8 @@ class WikipediaArtistCollector:
         """
         try:
             # Wikipedia API를 통해 Wikidata ID 가져오기
-            api_url = f"https://en.wikipedia.org/api/rest_v1/page/summary/{page.title}"
-            response = requests.get(api_url)
-            if response.status_code == 200:
-                data = response.json()
+            data = self.fetch_page_summary(page.title)
+            if data:
                 wikibase_item = data.get('wikibase_item')
                 if wikibase_item:
                     return wikibase_item
@@ -372,10 +1230,8 @@ class WikipediaArtistCollector:
         """
         try:
             # Wikipedia API를 통해 이미지 정보 가져오기
-            api_url = f"https://en.wikipedia.org/api/rest_v1/page/summary/{page.title}"
-            response = requests.get(api_url)
-            if response.status_code == 200:
-                data = response.json()
+            data = self.fetch_page_summary(page.title)
+            if data:
                 thumbnail = data.get('thumbnail', {})
                 if thumbnail:
                     return thumbnail.get('source')
@@ -384,6 +1240,26 @@ class WikipediaArtistCollector:
         
         return None
     
+    def extract_original_image(self, page) -> Optional[str]:
+        """원본 이미지 URL (초상화 저장소의 변형본 생성용, 요약 응답 재사용)"""
+        try:
+            data = self.fetch_page_summary(page.title)
+            if data:
+                return (data.get('originalimage') or {}).get('source')
+        except Exception as e:
+            logger.warning(f"원본 이미지 추출 실패: {e}")
+        
+        return None
+    
+    def fetch_page_summary(self, title: str) -> Optional[Dict]:
+        """REST 요약 조회 (Wikidata ID와 이미지가 공유, 실행 중 제목당 한 번만 요청)"""
+        def fetch():
+            api_url = f"https://en.wikipedia.org/api/rest_v1/page/summary/{title}"
+            response = self.session.get(api_url)
+            return response.json() if response.status_code == 200 else None
+        
+        return self.single_flight.do(('summary', title), fetch)
+    
     def extract_categories(self, page) -> List[str]:
         """
         Wikipedia 카테고리 추출
@@ -448,6 +1324,9 @@ class WikipediaArtistCollector:
         OpenAI를 사용한 아티스트 이름 번역
         """
         try:
+            import openai
+
+            openai.api_key = os.getenv('OPENAI_API_KEY')
             response = openai.ChatCompletion.create(
                 model="gpt-3.5-turbo",
                 messages=[
@@ -502,7 +1381,7 @@ class WikipediaArtistCollector:
             """
             
             url = "https://query.wikidata.org/sparql"
-            response = requests.get(url, params={
+            response = self.session.get(url, params={
                 'query': query,
                 'format': 'json'
             }, headers={
@@ -545,13 +1424,32 @@ class WikipediaArtistCollector:
         
         return artist_info
     
+    def resolve_locally(self, artist_name: str) -> Optional[str]:
+        """로컬 해석기로 제목 조회 (첫 호출 시 artists 이름을 색인에 추가)"""
+        if not self._resolver_db_loaded:
+            with self._resolver_db_lock:
+                if not self._resolver_db_loaded:
+                    try:
+                        conn = connect_database(self.db_config)
+                        cursor = conn.cursor()
+                        cursor.execute("SELECT name, name_ko FROM artists")
+                        self.resolver.load_artist_names(cursor.fetchall())
+                        cursor.close()
+                        conn.close()
+                        logger.info(f"🔤 로컬 이름 해석기 색인: {len(self.resolver)}개")
+                    except Exception as e:
+                        logger.warning(f"artists 이름 색인 실패: {e}")
+                    self._resolver_db_loaded = True
+        
+        return self.resolver.resolve(artist_name)
+    
     def search_variations(self, artist_name: str) -> List[str]:
         """
         아티스트 이름 변형 검색
         """
         try:
             api_url = "https://en.wikipedia.org/api/rest_v1/page/search"
-            response = requests.get(api_url, params={
+            response = self.session.get(api_url, params={
                 'q': artist_name,
                 'limit': 5
             })
@@ -566,23 +1464,179 @@ class WikipediaArtistCollector:
         
         return []
     
+    # UPDATE 시 COALESCE(new, old) 로 반영되는 컬럼 (변경 감지 대상)
+    PERSISTED_COLUMNS = (
+        'name_ko', 'birth_year', 'death_year', 'nationality', 'nationality_ko',
+        'bio', 'bio_ko', 'era', 'images', 'sources', 'official_links'
+    )
+    
+    def persisted_values(self, artist_info: ArtistInfo, columns: Optional[set] = None) -> Dict[str, Any]:
+        """
+        ArtistInfo → artists 테이블에 기록될 컬럼 값
+
+        columns 가 주어지면(백필) 그 밖의 컬럼은 None 으로 두어 기존 값을 유지한다.
+        """
+        values = {
+            'name_ko': artist_info.name_ko,
+            'birth_year': artist_info.birth_year,
+            'death_year': artist_info.death_year,
+            'nationality': artist_info.nationality,
+            'nationality_ko': artist_info.nationality_ko,
+            'bio': artist_info.biography,
+            'bio_ko': artist_info.biography_ko,
+            'era': self.classify_era(artist_info.birth_year, artist_info.death_year),
+            'images': self.images_payload(artist_info),
+            'sources': {
+                'wikipedia': 'collected',
+                'wikidata': artist_info.wikidata_id
+            },
+            'official_links': {'wikipedia': artist_info.wikipedia_url} if artist_info.wikipedia_url else {}
+        }
+        if columns is not None:
+            values = {col: value if col in columns else None for col, value in values.items()}
+        return values
+    
+    # 로컬 초상화 저장소 키 (--download-portraits 실행에서만 채워짐)
+    PORTRAIT_STORE_KEYS = ('portrait_key', 'portrait_variants')
+    
+    @staticmethod
+    def images_payload(artist_info: ArtistInfo) -> Dict[str, Any]:
+        """images 컬럼에 병합할 값 (원본 URL + 로컬 저장소 키), 초상화가 없으면 None (기존 값 유지)"""
+        if not artist_info.image_url:
+            return None
+        images = {'portrait': artist_info.image_url}
+        if artist_info.image_key:
+            images['portrait_key'] = artist_info.image_key
+        if artist_info.image_variants:
+            images['portrait_variants'] = artist_info.image_variants
+        return images
+    
+    @classmethod
+    def stale_image_keys(cls, current: Optional[Dict[str, Any]], payload: Optional[Dict[str, Any]]) -> List[str]:
+        """초상화 URL이 바뀌었는데 새 저장소 키가 없으면 이전 키는 다른 이미지를 가리키므로 제거"""
+        if not payload or not current or current.get('portrait') == payload.get('portrait'):
+            return []
+        return [key for key in cls.PORTRAIT_STORE_KEYS if key in current and key not in payload]
+    
+    @classmethod
+    def merge_images(cls, current: Optional[Dict[str, Any]], payload: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """UPDATE 의 images 병합(기존 JSONB - 낡은 키 || 새 값)과 같은 결과"""
+        if payload is None:
+            return current
+        stale = cls.stale_image_keys(current, payload)
+        merged = {key: value for key, value in (current or {}).items() if key not in stale}
+        merged.update(payload)
+        return merged
+    
+    @staticmethod
+    def content_fingerprint(values: Dict[str, Any]) -> str:
+        """저장 대상 컬럼 값의 콘텐츠 지문 (정렬된 JSON의 SHA-256)"""
+        canonical = json.dumps(values, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+    
     def save_to_database(self, artist_info: ArtistInfo) -> bool:
         """
         데이터베이스에 아티스트 정보 저장
         """
+        return self.save_many_to_database([artist_info])[0] != 'failed'
+    
+    def save_many_to_database(self, artist_infos: List[ArtistInfo],
+                              columns: Optional[List[Optional[set]]] = None) -> List[str]:
+        """
+        여러 아티스트 정보를 한 번에 저장
+
+        기존 행을 한 번의 쿼리로 가져와 COALESCE 적용 후 값의 지문을 현재 행과 비교하고,
+        실제로 바뀐 행만 UPDATE 한다 (불필요한 WAL/인덱스 갱신 방지).
+        columns(입력별 기록할 컬럼 set, None 이면 전체)는 백필에서 비어 있던 컬럼만 채울 때 쓴다.
+        배치 저장이 실패하면 행 단위로 다시 저장하여 문제가 된 행만 'failed' 가 된다.
+        반환값은 입력 순서대로 'inserted' | 'updated' | 'unchanged' | 'failed'.
+        """
+        if not artist_infos:
+            return []
+        
+        columns = columns or [None] * len(artist_infos)
+        conn = None
         try:
-            conn = psycopg2.connect(**self.db_config)
-            cursor = conn.cursor(cursor_factory=RealDictCursor)
+            from psycopg2.extras import execute_batch
+            
+            conn = connect_database(self.db_config)
+            cursor = conn.cursor()
             
-            # 중복 확인
+            # 중복 확인 (일괄 조회)
+            keys = list({info.name.lower() for info in artist_infos})
             cursor.execute(
-                "SELECT id FROM artists WHERE LOWER(name) = LOWER(%s)",
-                (artist_info.name,)
+                f"SELECT id, LOWER(name) AS name_key, {', '.join(self.PERSISTED_COLUMNS)} "
+                "FROM artists WHERE LOWER(name) = ANY(%s)",
+                (keys,)
             )
+            existing_rows = {}
+            for row in cursor.fetchall():
+                existing_rows.setdefault(row['name_key'], row)
             
-            existing = cursor.fetchone()
+            statuses = []
+            updates = []
+            inserts = []
+            seen = set()
             
-            if existing:
+            for artist_info, info_columns in zip(artist_infos, columns):
+                key = artist_info.name.lower()
+                values = self.persisted_values(artist_info, info_columns)
+                existing = existing_rows.get(key)
+                
+                if key in seen:
+                    # 같은 배치 안의 중복 이름은 한 번만 기록
+                    statuses.append('unchanged')
+                    continue
+                seen.add(key)
+                
+                if existing:
+                    current = {col: existing[col] for col in self.PERSISTED_COLUMNS}
+                    merged = {col: values[col] if values[col] is not None else current[col]
+                              for col in self.PERSISTED_COLUMNS}
+                    # images 는 덮어쓰지 않고 병합 (--download-portraits 없이 실행해도 저장소 키 유지)
+                    merged['images'] = self.merge_images(current['images'], values['images'])
+                    
+                    if self.content_fingerprint(merged) == self.content_fingerprint(current):
+                        statuses.append('unchanged')
+                        continue
+                    
+                    updates.append((
+                        values['name_ko'],
+                        values['birth_year'],
+                        values['death_year'],
+                        values['nationality'],
+                        values['nationality_ko'],
+                        values['bio'],
+                        values['bio_ko'],
+                        values['era'],
+                        self.stale_image_keys(current['images'], values['images']),
+                        # 백필에서 제외된 JSONB 컬럼은 'null' 이 아닌 NULL 로 보내야 COALESCE 로 유지됨
+                        json.dumps(values['images']) if values['images'] is not None else None,
+                        json.dumps(values['sources']) if values['sources'] is not None else None,
+                        json.dumps(values['official_links']) if values['official_links'] is not None else None,
+                        existing['id']
+                    ))
+                    statuses.append('updated')
+                else:
+                    inserts.append((
+                        artist_info.name,
+                        values['name_ko'],
+                        values['birth_year'],
+                        values['death_year'],
+                        values['nationality'],
+                        values['nationality_ko'],
+                        values['bio'],
+                        values['bio_ko'],
+                        self.determine_copyright_status(artist_info),
+                        values['era'],
+                        json.dumps(values['images'] or {}),
+                        json.dumps(values['sources']),
+                        json.dumps(values['official_links']),
+                        len(artist_info.notable_works or []) > 5  # 유명 작품이 많으면 featured
+                    ))
+                    statuses.append('inserted')
+            
+            if updates:
                 # 업데이트
                 update_query = """
                 UPDATE artists SET
@@ -594,35 +1648,15 @@ class WikipediaArtistCollector:
                     bio = COALESCE(%s, bio),
                     bio_ko = COALESCE(%s, bio_ko),
                     era = COALESCE(%s, era),
-                    images = COALESCE(%s, images),
+                    images = COALESCE((COALESCE(images, '{}'::jsonb) - %s::text[]) || %s::jsonb, images),
                     sources = COALESCE(%s, sources),
                     official_links = COALESCE(%s, official_links),
                     updated_at = CURRENT_TIMESTAMP
                 WHERE id = %s
-                RETURNING id
                 """
-                
-                cursor.execute(update_query, (
-                    artist_info.name_ko,
-                    artist_info.birth_year,
-                    artist_info.death_year,
-                    artist_info.nationality,
-                    artist_info.nationality_ko,
-                    artist_info.biography,
-                    artist_info.biography_ko,
-                    self.classify_era(artist_info.birth_year, artist_info.death_year),
-                    json.dumps({'portrait': artist_info.image_url} if artist_info.image_url else {}),
-                    json.dumps({
-                        'wikipedia': 'collected',
-                        'wikidata': artist_info.wikidata_id
-                    }),
-                    json.dumps({'wikipedia': artist_info.wikipedia_url} if artist_info.wikipedia_url else {}),
-                    existing['id']
-                ))
-                
-                logger.info(f"✅ 아티스트 정보 업데이트: {artist_info.name}")
-                
-            else:
+                execute_batch(cursor, update_query, updates)
+            
+            if inserts:
                 # 새로 삽입
                 insert_query = """
                 INSERT INTO artists (
@@ -630,64 +1664,61 @@ class WikipediaArtistCollector:
                     bio, bio_ko, copyright_status, era, images, sources, official_links,
                     is_featured
                 ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                RETURNING id
                 """
-                
-                cursor.execute(insert_query, (
-                    artist_info.name,
-                    artist_info.name_ko,
-                    artist_info.birth_year,
-                    artist_info.death_year,
-                    artist_info.nationality,
-                    artist_info.nationality_ko,
-                    artist_info.biography,
-                    artist_info.biography_ko,
-                    self.determine_copyright_status(artist_info),
-                    self.classify_era(artist_info.birth_year, artist_info.death_year),
-                    json.dumps({'portrait': artist_info.image_url} if artist_info.image_url else {}),
-                    json.dumps({
-                        'wikipedia': 'collected',
-                        'wikidata': artist_info.wikidata_id
-                    }),
-                    json.dumps({'wikipedia': artist_info.wikipedia_url} if artist_info.wikipedia_url else {}),
-                    len(artist_info.notable_works or []) > 5  # 유명 작품이 많으면 featured
-                ))
-                
-                logger.info(f"✅ 새 아티스트 정보 저장: {artist_info.name}")
+                execute_batch(cursor, insert_query, inserts)
             
             conn.commit()
             cursor.close()
             conn.close()
             
-            return True
+            logger.info(
+                f"✅ 아티스트 정보 저장: 신규 {statuses.count('inserted')}, "
+                f"변경 {statuses.count('updated')}, 변경 없음 {statuses.count('unchanged')}"
+            )
+            return statuses
             
         except Exception as e:
             logger.error(f"❌ DB 저장 실패: {e}")
-            return False
+            if conn is not None and not conn.closed:
+                conn.close()
+            if len(artist_infos) > 1:
+                # 한 행의 잘못된 값 때문에 배치 전체를 버리지 않도록 행 단위로 다시 저장
+                logger.warning(f"🔁 {len(artist_infos)}명 개별 저장으로 재시도")
+                return [self.save_many_to_database([artist_info], [info_columns])[0]
+                        for artist_info, info_columns in zip(artist_infos, columns)]
+            return ['failed']
+    
+    # 시대 분류 기준: 활동 종료 연도(사망 연도, 생존 시 올해)가 경계 미만이면 해당 시대
+    # classify_era 와 recompute_classification(SQL)이 같은 표를 사용
+    ERA_BOUNDARIES = (
+        (1400, 'Medieval'),
+        (1600, 'Renaissance'),
+        (1750, 'Baroque'),
+        (1850, 'Neoclassicism'),
+        (1900, 'Impressionism'),
+        (1945, 'Modern'),
+        (1980, 'Postmodern')
+    )
+    DEFAULT_ERA = 'Contemporary'
+    
+    # 저작권 상태 기준 (사망 후 경과 연수 / 생존 여부 불명 시 출생 후 연수)
+    PUBLIC_DOMAIN_YEARS_AFTER_DEATH = 70
+    TRANSITIONAL_YEARS_AFTER_DEATH = 50
+    PUBLIC_DOMAIN_YEARS_AFTER_BIRTH = 150
+    # determine_copyright_status 가 내는 값 (그 밖의 값은 수동 지정: verified_artist, estate_managed 등)
+    COPYRIGHT_STATUSES = ('public_domain', 'transitional', 'licensed', 'contemporary', 'unknown')
     
     def classify_era(self, birth_year: int, death_year: int) -> str:
         """시대 분류"""
         if not birth_year:
-            return 'Contemporary'
+            return self.DEFAULT_ERA
         
         active_year = death_year or datetime.now().year
         
-        if active_year < 1400:
-            return 'Medieval'
-        elif active_year < 1600:
-            return 'Renaissance'
-        elif active_year < 1750:
-            return 'Baroque'
-        elif active_year < 1850:
-            return 'Neoclassicism'
-        elif active_year < 1900:
-            return 'Impressionism'
-        elif active_year < 1945:
-            return 'Modern'
-        elif active_year < 1980:
-            return 'Postmodern'
-        else:
-            return 'Contemporary'
+        for boundary, era in self.ERA_BOUNDARIES:
+            if active_year < boundary:
+                return era
+        return self.DEFAULT_ERA
     
     def determine_copyright_status(self, artist_info: ArtistInfo) -> str:
         """저작권 상태 판단"""
@@ -695,84 +1726,881 @@ class WikipediaArtistCollector:
         
         if artist_info.death_year:
             years_since_death = current_year - artist_info.death_year
-            if years_since_death >= 70:
+            if years_since_death >= self.PUBLIC_DOMAIN_YEARS_AFTER_DEATH:
                 return 'public_domain'
-            elif years_since_death >= 50:
+            elif years_since_death >= self.TRANSITIONAL_YEARS_AFTER_DEATH:
                 return 'transitional'
             else:
                 return 'licensed'
         elif artist_info.birth_year:
             age = current_year - artist_info.birth_year
-            if age > 150:
+            if age > self.PUBLIC_DOMAIN_YEARS_AFTER_BIRTH:
                 return 'public_domain'
             else:
                 return 'contemporary'
         
         return 'unknown'
     
-    def process_batch(self, artist_names: List[str]) -> Dict[str, Any]:
+    def era_sql(self) -> str:
+        """classify_era 와 같은 규칙의 SQL 식 (%(current_year)s 파라미터)"""
+        branches = '\n'.join(
+            f"    WHEN COALESCE(NULLIF(death_year, 0), %(current_year)s) < {boundary} THEN '{era}'"
+            for boundary, era in self.ERA_BOUNDARIES
+        )
+        return (
+            "CASE\n"
+            f"    WHEN COALESCE(birth_year, 0) = 0 THEN '{self.DEFAULT_ERA}'\n"
+            f"{branches}\n"
+            f"    ELSE '{self.DEFAULT_ERA}'\n"
+            "END"
+        )
+    
+    def copyright_status_sql(self) -> str:
+        """determine_copyright_status 와 같은 규칙의 SQL 식 (%(current_year)s 파라미터)"""
+        return f"""CASE
+    WHEN COALESCE(death_year, 0) <> 0 THEN
+        CASE
+            WHEN %(current_year)s - death_year >= {self.PUBLIC_DOMAIN_YEARS_AFTER_DEATH} THEN 'public_domain'
+            WHEN %(current_year)s - death_year >= {self.TRANSITIONAL_YEARS_AFTER_DEATH} THEN 'transitional'
+            ELSE 'licensed'
+        END
+    WHEN COALESCE(birth_year, 0) <> 0 THEN
+        CASE
+            WHEN %(current_year)s - birth_year > {self.PUBLIC_DOMAIN_YEARS_AFTER_BIRTH} THEN 'public_domain'
+            ELSE 'contemporary'
+        END
+    ELSE 'unknown'
+END"""
+    
+    def era_recompute_sql(self) -> str:
+        """
+        recompute_classification 의 새 era 식
+
+        era 가 올해에 따라 바뀌는 행(생년은 있고 사망 연도가 없음) 중 era 가 비었거나 이 수집기의
+        분류 값(ERA_BOUNDARIES/DEFAULT_ERA)인 행만 다시 계산하고, 나머지는 기존 값을 유지한다.
+        (Post-Impressionism, Cubism 같은 큐레이션된 사조 값을 덮어쓰지 않음)
+        """
+        vocabulary = ', '.join(f"'{era}'" for _, era in self.ERA_BOUNDARIES)
+        return f"""CASE
+    WHEN COALESCE(death_year, 0) = 0 AND COALESCE(birth_year, 0) <> 0
+         AND (era IS NULL OR era IN ({vocabulary}, '{self.DEFAULT_ERA}'))
+    THEN {self.era_sql()}
+    ELSE era
+END"""
+    
+    def copyright_status_recompute_sql(self) -> str:
+        """
+        recompute_classification 의 새 copyright_status 식
+
+        비어 있거나 이 수집기의 규칙 값(COPYRIGHT_STATUSES)인 행만 다시 계산하고,
+        수동으로 지정한 상태(verified_artist, estate_managed 등)는 유지한다.
+        """
+        vocabulary = ', '.join(f"'{status}'" for status in self.COPYRIGHT_STATUSES)
+        return f"""CASE
+    WHEN copyright_status IS NULL OR copyright_status IN ({vocabulary})
+    THEN {self.copyright_status_sql()}
+    ELSE copyright_status
+END"""
+    
+    def recompute_classification(self, dry_run: bool = False) -> Dict[str, Any]:
+        """
+        artists 전체의 copyright_status (와 올해에 따라 바뀌는 era)를 한 번의 집합 연산으로 재계산
+
+        Wikipedia 요청 없이 저장된 생몰년만으로 계산하며, 값이 바뀐 행만 갱신한다.
+        재계산 범위는 era_recompute_sql, copyright_status_recompute_sql 참고. dry_run 이면 UPDATE 없이 같은 계산을
+        SELECT 로 집계만 하여 행 잠금이나 WAL, dead tuple 이 생기지 않는다.
+        """
+        computed = f"""
+        WITH computed AS (
+            SELECT
+                id,
+                era AS old_era,
+                copyright_status AS old_status,
+                {self.era_recompute_sql()} AS new_era,
+                {self.copyright_status_recompute_sql()} AS new_status
+            FROM artists
+        )"""
+        if dry_run:
+            query = computed + """
+        SELECT old_era, new_era, old_status, new_status, COUNT(*) AS count
+        FROM computed
+        WHERE old_era IS DISTINCT FROM new_era
+           OR old_status IS DISTINCT FROM new_status
+        GROUP BY old_era, new_era, old_status, new_status
+        """
+        else:
+            query = computed + """,
+        changed AS (
+            UPDATE artists a
+            SET era = c.new_era,
+                copyright_status = c.new_status
+            FROM computed c
+            WHERE a.id = c.id
+              AND (a.era IS DISTINCT FROM c.new_era
+                   OR a.copyright_status IS DISTINCT FROM c.new_status)
+            RETURNING c.old_era, c.new_era, c.old_status, c.new_status
+        )
+        SELECT old_era, new_era, old_status, new_status, COUNT(*) AS count
+        FROM changed
+        GROUP BY old_era, new_era, old_status, new_status
+        """
+        
+        conn = connect_database(self.db_config)
+        try:
+            cursor = conn.cursor()
+            cursor.execute(query, {'current_year': datetime.now().year})
+            rows = cursor.fetchall()
+            if dry_run:
+                conn.rollback()
+            else:
+                conn.commit()
+            cursor.close()
+        finally:
+            conn.close()
+        
+        summary = {'changed': 0, 'copyright_status': {}, 'era': {}, 'dry_run': dry_run}
+        for row in rows:
+            summary['changed'] += row['count']
+            if row['old_status'] != row['new_status']:
+                transition = f"{row['old_status']} → {row['new_status']}"
+                summary['copyright_status'][transition] = summary['copyright_status'].get(transition, 0) + row['count']
+            if row['old_era'] != row['new_era']:
+                transition = f"{row['old_era']} → {row['new_era']}"
+                summary['era'][transition] = summary['era'].get(transition, 0) + row['count']
+        
+        logger.info(f"🗂️ 분류 재계산{' (dry-run)' if dry_run else ''}: {summary['changed']}개 행 변경")
+        return summary
+    
+    def resolve_canonical_titles(self, artist_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        입력 이름 → 정규 문서 {'pageid', 'title'} 일괄 조회
+
+        MediaWiki action API로 50개씩 묶어 정규화/리다이렉트를 한 번에 따라간다.
+        존재하지 않는 문서나 조회에 실패한 묶음의 이름은 결과에 포함되지 않는다.
+        """
+        resolved = {}
+        unique_names = list(dict.fromkeys(artist_names))
+        
+        for start in range(0, len(unique_names), 50):
+            chunk = unique_names[start:start + 50]
+            try:
+                response = self.session.get('https://en.wikipedia.org/w/api.php', params={
+                    'action': 'query',
+                    'titles': '|'.join(chunk),
+                    'redirects': 1,
+                    'format': 'json',
+                    'formatversion': 2
+                })
+                if response.status_code != 200:
+                    logger.warning(f"정규 문서 조회 실패 ({response.status_code})")
+                    continue
+                query = response.json().get('query', {})
+            except Exception as e:
+                # 실패한 묶음의 이름만 입력 이름 그대로 처리 (앞서 조회한 묶음은 유지)
+                logger.warning(f"정규 문서 조회 실패 ({len(chunk)}개): {e}")
+                continue
+            
+            normalized = {item['from']: item['to'] for item in query.get('normalized', [])}
+            redirects = {item['from']: item['to'] for item in query.get('redirects', [])}
+            pages = {
+                page['title']: {'pageid': page['pageid'], 'title': page['title']}
+                for page in query.get('pages', [])
+                if not page.get('missing') and not page.get('invalid') and 'pageid' in page
+            }
+            
+            for name in chunk:
+                title = normalized.get(name, name)
+                title = redirects.get(title, title)
+                if title in pages:
+                    resolved[name] = pages[title]
+        
+        return resolved
+    
+    def group_by_canonical(self, artist_names: List[str]) -> List[Dict[str, Any]]:
+        """
+        입력 이름을 정규 문서별로 묶음 → [{'title', 'names', 'resolved', 'aliases'}], 입력 순서 유지
+
+        정규 문서를 찾지 못한 이름은 로컬 해석기로 보정하고, 그래도 없으면 각자 한 그룹이 되어
+        search_artist의 검색 변형을 거친다. aliases 는 리다이렉트/정규화로 제목과 달라진 입력 이름으로,
+        문서가 아티스트로 확인된 뒤에만 해석 캐시에 기록한다.
+        """
+        try:
+            resolved = self.resolve_canonical_titles(artist_names)
+        except Exception as e:
+            logger.warning(f"정규 문서 조회 실패, 입력 이름 그대로 처리: {e}")
+            resolved = {}
+        
+        groups = {}
+        for name in artist_names:
+            page = resolved.get(name)
+            title = page['title'] if page else (self.resolve_locally(name) or name)
+            group = groups.setdefault(title.lower(), {'title': title, 'names': [], 'resolved': False, 'aliases': []})
+            group['names'].append(name)
+            if page and name != title:
+                group['aliases'].append(name)
+            group['resolved'] = group['resolved'] or page is not None or title != name
+        return list(groups.values())
+    
+    # 수집 단계별 예상 HTTP 요청 수 (스케줄러 비용 추정용)
+    REQUEST_COSTS = {
+        'page': 2,        # 문서 존재 확인 + 본문
+        'search': 2,      # 검색 변형 + 재조회
+        'korean': 2,      # 한국어 문서 (+ 번역 후 재조회)
+        'wikidata': 1,
+        'summary': 1,     # REST 요약 (Wikidata ID, 이미지 공유)
+        'details': 2      # 카테고리 + 링크
+    }
+    
+    def estimate_request_cost(self, group: Dict[str, Any], missing: Optional[set]) -> int:
+        """
+        그룹 수집에 필요한 예상 요청 수 (정규 문서 해석 여부와 수집할 단계 반영)
+
+        REST 요약은 배치마다 SingleFlight 가 비워지므로 계획 시점에는 항상 새로 요청하는 것으로 센다.
+        """
+        costs = self.REQUEST_COSTS
+        cost = costs['page'] + costs['summary']
+        if not group.get('resolved'):
+            cost += costs['search']
+        if missing is None or 'name_ko' in missing:
+            cost += costs['korean']
+        if missing is None or 'birth_year' in missing:
+            cost += costs['wikidata']
+        if missing is None:
+            cost += costs['details']
+        return cost
+    
+    def fetch_artist_metadata(self, names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        스케줄링용 기존 행 정보 일괄 조회 → 소문자 이름: {featured, staleness_days, missing}
+        (--no-db 이거나 조회에 실패하면 빈 dict)
+        """
+        if self.ndjson_writer or not names:
+            return {}
+        
+        missing_columns = ',\n'.join(
+            f"({condition}) AS missing_{field}" for field, condition in self.BACKFILL_FIELDS.items()
+        )
+        try:
+            conn = connect_database(self.db_config)
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT LOWER(name) AS name_key, is_featured,
+                       EXTRACT(EPOCH FROM (CURRENT_TIMESTAMP - updated_at)) / 86400 AS staleness_days,
+                       {missing_columns}
+                FROM artists
+                WHERE LOWER(name) = ANY(%s)
+            """, (list({name.lower() for name in names}),))
+            metadata = {}
+            for row in cursor.fetchall():
+                metadata.setdefault(row['name_key'], {
+                    'featured': bool(row['is_featured']),
+                    'staleness_days': float(row['staleness_days'] or 0),
+                    'missing': {field for field in self.BACKFILL_FIELDS if row[f'missing_{field}']}
+                })
+            cursor.close()
+            conn.close()
+            return metadata
+        except Exception as e:
+            logger.warning(f"스케줄링용 아티스트 정보 조회 실패: {e}")
+            return {}
+    
+    def plan_group(self, group: Dict[str, Any], metadata: Dict[str, Dict[str, Any]],
+                   missing_fields: Optional[Dict[str, set]]) -> Dict[str, Any]:
+        """정규 문서 그룹 → 스케줄러 작업 (우선순위 입력값과 예상 비용)"""
+        rows = [metadata[key] for key in {name.lower() for name in group['names']} | {group['title'].lower()}
+                if key in metadata]
+        
+        missing = None
+        if missing_fields is not None:
+            missing = set().union(*(missing_fields.get(name, set()) for name in group['names']))
+        
+        if missing is not None:
+            missing_count = len(missing)
+        elif rows:
+            missing_count = max(len(row['missing']) for row in rows)
+        else:
+            # 아직 DB에 없는 아티스트
+            missing_count = len(self.BACKFILL_FIELDS)
+        
+        return {
+            **group,
+            'missing': missing,
+            'missing_count': missing_count,
+            'featured': any(row['featured'] for row in rows),
+            'staleness_days': max((row['staleness_days'] for row in rows), default=BatchScheduler.MAX_STALENESS_DAYS),
+            'cost': self.estimate_request_cost(group, missing)
+        }
+    
+    def process_batch(self, artist_names: List[str],
+                      missing_fields: Optional[Dict[str, set]] = None) -> Dict[str, Any]:
         """
         배치로 여러 아티스트 처리
+
+        고정 지연 대신 호스트별 적응형 동시성 한도(AIMD)로 요청 속도를 조절한다.
+        입력 이름은 먼저 정규 문서로 묶어 문서당 한 번만 수집하고 결과를 모든 별칭에 나눠준다.
+        작업은 파일 순서가 아니라 BatchScheduler 우선순위 순으로 시작하며, 실행 예산(self.budget)이
+        소진되면 새 작업을 멈추고 남은 작업은 results['deferred'] 에 남긴다.
+        수집 결과는 SAVE_BATCH_SIZE 단위로 모아 일괄 저장하고, 변경되지 않은 행은 건너뛴다.
+        missing_fields(이름 → 비어 있는 필드)가 주어지면 백필로 처리하여 해당 필드만 수집하고
+        결과를 입력 이름의 기존 행에 기록한다.
         """
         results = {
             'successful': [],
             'failed': [],
-            'total': len(artist_names)
+            'deferred': [],
+            'total': len(artist_names),
+            'changes': {}
         }
+        pending = []
         
-        logger.info(f"📦 배치 처리 시작: {len(artist_names)}명의 아티스트")
-        
-        for i, name in enumerate(artist_names, 1):
-            logger.info(f"🎨 처리 중 [{i}/{len(artist_names)}]: {name}")
-            
-            try:
-                artist_info = self.search_artist(name)
-                if artist_info:
-                    if self.save_to_database(artist_info):
-                        results['successful'].append({
+        def flush():
+            statuses = self.persist_many([info for _, info, _ in pending], [cols for _, _, cols in pending])
+            for (names, artist_info, _), status in zip(pending, statuses):
+                for name in names:
+                    if status == 'failed':
+                        results['failed'].append({
                             'name': name,
-                            'info': artist_info
+                            'error': 'Database save failed'
                         })
                     else:
-                        results['failed'].append({
+                        results['successful'].append({
                             'name': name,
-                            'error': 'Database save failed'
+                            'info': artist_info
                         })
-                else:
-                    results['failed'].append({
-                        'name': name,
-                        'error': 'Artist not found or not valid'
-                    })
-                    
-            except Exception as e:
-                results['failed'].append({
-                    'name': name,
-                    'error': str(e)
-                })
+                if status != 'failed':
+                    results['changes'][status] = results['changes'].get(status, 0) + 1
+            pending.clear()
+        
+        logger.info(f"📦 배치 처리 시작: {len(artist_names)}명의 아티스트 (최대 동시성 {self.max_concurrency})")
+        
+        groups = self.group_by_canonical(artist_names)
+        coalesced_before = self.single_flight.coalesced
+        logger.info(f"🔗 정규 문서 {len(groups)}개로 통합 (별칭 {len(artist_names) - len(groups)}개)")
+        
+        scheduler = BatchScheduler(self.budget, self.priority_weights)
+        metadata = self.fetch_artist_metadata(
+            list(artist_names) + [group['title'] for group in groups]
+        )
+        for group in groups:
+            scheduler.push(self.plan_group(group, metadata, missing_fields))
+        
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            in_flight = {}
+            completed = 0
+            
+            def dispatch():
+                # 동시성 한도만큼 우선순위가 높은 작업부터 시작 (진행 중 작업의 예상 요청은 예약)
+                while len(in_flight) < self.max_concurrency:
+                    item = scheduler.pop(reserved_requests=sum(running['cost'] for running in in_flight.values()))
+                    if item is None:
+                        return
+                    in_flight[executor.submit(self.search_artist, item['title'], item['missing'])] = item
             
-            # API 율한 제한 고려한 지연
-            import time
-            time.sleep(1)
+            dispatch()
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    group = in_flight.pop(future)
+                    completed += 1
+                    try:
+                        artist_info = future.result()
+                        error = None if artist_info else 'Artist not found or not valid'
+                    except Exception as e:
+                        artist_info, error = None, str(e)
+                    
+                    if artist_info:
+                        # 아티스트 문서로 확인된 정규 문서만 해석 캐시에 기록
+                        for name in group['aliases']:
+                            self.resolver.learn(name, group['title'])
+                        if missing_fields is not None:
+                            # 백필: 문서 제목이 달라도 각 별칭의 기존 행을 갱신하되, 그 행에서 비어 있던
+                            # 컬럼만 기록 (나머지는 정규식 추출 값으로 기존 값을 덮어쓰지 않음)
+                            pending.extend(
+                                ([name], replace(artist_info, name=name), missing_fields.get(name, set()))
+                                for name in group['names']
+                            )
+                        else:
+                            pending.append((group['names'], artist_info, None))
+                        if len(pending) >= self.SAVE_BATCH_SIZE:
+                            flush()
+                    else:
+                        results['failed'].extend({
+                            'name': name,
+                            'error': error
+                        } for name in group['names'])
+                    logger.info(f"🎨 처리 완료 [{completed}/{len(groups)}]: {group['title']} (우선순위 {group['priority']})")
+                dispatch()
+        
+        flush()
+        for item in scheduler.deferred:
+            results['deferred'].extend({
+                'name': name,
+                'reason': item['reason'],
+                'priority': item['priority'],
+                'expected_requests': item['cost']
+            } for name in item['names'])
+        if results['deferred']:
+            logger.warning(f"⏸️ 예산 소진으로 보류: {len(results['deferred'])}명")
+        self.single_flight.clear()
+        results['canonical'] = {
+            'pages': len(groups),
+            'aliases_merged': len(artist_names) - len(groups),
+            'coalesced_calls': self.single_flight.coalesced - coalesced_before
+        }
+        results['concurrency'] = self.concurrency.snapshot()
+        if self.budget:
+            results['budget'] = self.budget.snapshot()
         
         logger.info(f"📦 배치 처리 완료: 성공 {len(results['successful'])}, 실패 {len(results['failed'])}")
+        logger.info(f"💾 저장 결과: {results['changes']}")
+        for host, stats in results['concurrency'].items():
+            logger.info(
+                f"🚦 {host}: 한도 {stats['limit']} (최대 {stats['peak_limit']}), "
+                f"요청 {stats['requests']}, 제한 {stats['throttled']}"
+            )
         return results
+    
+    # 백필 대상 필드 (artists 컬럼 → 비어 있음 판정 SQL)
+    BACKFILL_FIELDS = {
+        'name_ko': "name_ko IS NULL OR name_ko = ''",
+        'birth_year': "birth_year IS NULL",
+        'bio': "bio IS NULL OR bio = ''",
+        'images': "images IS NULL OR images = '{}'::jsonb"
+    }
+    
+    def iter_backfill_candidates(self, limit: Optional[int] = None, page_size: int = 500):
+        """
+        필드가 비어 있는 artists 행을 키셋 페이지네이션으로 스트리밍
+        → (이름, 비어 있는 필드 set), is_featured → follow_count 순
+
+        페이지마다 짧은 트랜잭션으로 조회하고 커밋하므로, 네트워크 수집이 몇 시간 걸려도
+        트랜잭션을 열어 둔 채 xmin을 붙잡지 않는다 (VACUUM, idle_in_transaction_session_timeout).
+        """
+        missing_columns = ',\n'.join(
+            f"({condition}) AS missing_{field}" for field, condition in self.BACKFILL_FIELDS.items()
+        )
+        where = ' OR '.join(f"({condition})" for condition in self.BACKFILL_FIELDS.values())
+        # 정렬 키를 모두 오름차순 식으로 바꿔 (..) > (마지막 키) 행 비교로 다음 페이지를 찾음
+        sort_key = "(NOT COALESCE(is_featured, FALSE)), -COALESCE(follow_count, 0), id"
+        query = f"""
+            SELECT name, (NOT COALESCE(is_featured, FALSE)) AS key_featured,
+                   -COALESCE(follow_count, 0) AS key_follow, id AS key_id,
+            {missing_columns}
+            FROM artists
+            WHERE ({where})
+              AND (%(last)s::boolean IS NULL OR ({sort_key}) > (%(last)s, %(last_follow)s, %(last_id)s))
+            ORDER BY {sort_key}
+            LIMIT %(page_size)s
+        """
+        
+        conn = connect_database(self.db_config)
+        try:
+            last = {'last': None, 'last_follow': None, 'last_id': None}
+            remaining = limit
+            while remaining is None or remaining > 0:
+                size = page_size if remaining is None else min(page_size, remaining)
+                with conn.cursor() as cursor:
+                    cursor.execute(query, {**last, 'page_size': size})
+                    rows = cursor.fetchall()
+                conn.commit()
+                
+                for row in rows:
+                    yield row['name'], {field for field in self.BACKFILL_FIELDS if row[f'missing_{field}']}
+                if len(rows) < size:
+                    break
+                tail = rows[-1]
+                last = {'last': tail['key_featured'], 'last_follow': tail['key_follow'], 'last_id': tail['key_id']}
+                if remaining is not None:
+                    remaining -= len(rows)
+        finally:
+            conn.close()
+    
+    def process_backfill(self, limit: Optional[int] = None, chunk_size: int = 100) -> Dict[str, Any]:
+        """
+        DB의 불완전한 아티스트를 chunk_size 단위로 배치 수집
+
+        행을 키셋 페이지 단위로 읽고 결과는 개수만 누적하므로 테이블 크기와 무관하게 메모리가 일정하다.
+        """
+        summary = {
+            'total': 0,
+            'successful': 0,
+            'failed': 0,
+            'deferred': 0,
+            'failed_samples': [],
+            'changes': {}
+        }
+        
+        def run(chunk):
+            results = self.process_batch([name for name, _ in chunk], missing_fields=dict(chunk))
+            summary['total'] += results['total']
+            summary['successful'] += len(results['successful'])
+            summary['failed'] += len(results['failed'])
+            summary['deferred'] += len(results['deferred'])
+            room = 50 - len(summary['failed_samples'])
+            summary['failed_samples'].extend(results['failed'][:max(0, room)])
+            for status, count in results['changes'].items():
+                summary['changes'][status] = summary['changes'].get(status, 0) + count
+        
+        logger.info("🩹 백필 시작: 비어 있는 필드가 있는 아티스트 스트리밍")
+        chunk = []
+        for name, missing in self.iter_backfill_candidates(limit=limit):
+            chunk.append((name, missing))
+            if len(chunk) >= chunk_size:
+                run(chunk)
+                chunk = []
+                if self.budget and self.budget.exhausted_reason():
+                    # 예산 소진: 나머지 후보는 읽지 않고 종료
+                    summary['stopped_early'] = self.budget.exhausted_reason()
+                    break
+        if chunk:
+            run(chunk)
+        
+        summary['concurrency'] = self.concurrency.snapshot()
+        if self.budget:
+            summary['budget'] = self.budget.snapshot()
+        logger.info(f"🩹 백필 완료: {summary['total']}명 중 성공 {summary['successful']}, 실패 {summary['failed']}")
+        return summary
+    
+    def run_queue_worker(self, queue: 'ArtistWorkQueue', batch_size: Optional[int] = None,
+                         follow: bool = False, poll_interval: float = 5.0) -> Dict[str, Any]:
+        """
+        대기열 워커: 작업을 가져와 수집/저장하고 결과를 대기열에 기록
+
+        follow 가 아니면 남은 작업이 없을 때 종료한다.
+        """
+        batch_size = batch_size or self.max_concurrency
+        stats = {'worker_id': queue.worker_id, 'completed': 0, 'retried': 0, 'failed': 0}
+        
+        logger.info(f"🧵 대기열 워커 시작: {queue.worker_id} (배치 {batch_size})")
+        queue.start_heartbeat()
+        
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                while True:
+                    if self.budget and self.budget.exhausted_reason():
+                        stats['stopped_early'] = self.budget.exhausted_reason()
+                        break
+                    items = queue.claim(batch_size)
+                    if not items:
+                        if not follow and not queue.has_remaining_work():
+                            break
+                        time.sleep(poll_interval)
+                        continue
+                    
+                    futures = {executor.submit(self._collect_and_save, item['artist_name']): item for item in items}
+                    for future in as_completed(futures):
+                        item = futures[future]
+                        try:
+                            artist_info, error = future.result()
+                        except Exception as e:
+                            artist_info, error = None, str(e)
+                        
+                        if artist_info:
+                            queue.complete(item['id'], artist_info.name)
+                            stats['completed'] += 1
+                            continue
+                        
+                        status = queue.fail(item['id'], error)
+                        if status == 'pending':
+                            stats['retried'] += 1
+                            logger.warning(f"🔁 재시도 예정 [{item['attempts']}/{item['max_attempts']}]: {item['artist_name']} ({error})")
+                        elif status == 'failed':
+                            stats['failed'] += 1
+                            logger.error(f"❌ 최종 실패: {item['artist_name']} ({error})")
+                        else:
+                            logger.warning(f"⚠️ 리스를 잃은 작업 (다른 워커가 재할당): {item['artist_name']}")
+                    
+                    self.single_flight.clear()
+        finally:
+            queue.close()
+        
+        stats['concurrency'] = self.concurrency.snapshot()
+        logger.info(f"🧵 대기열 워커 종료: 완료 {stats['completed']}, 재시도 {stats['retried']}, 실패 {stats['failed']}")
+        return stats
+    
+    def persist(self, artist_info: ArtistInfo) -> bool:
+        """수집 결과 저장 (--no-db 이면 NDJSON, 아니면 데이터베이스)"""
+        return self.persist_many([artist_info])[0] != 'failed'
+    
+    def persist_many(self, artist_infos: List[ArtistInfo],
+                     columns: Optional[List[Optional[set]]] = None) -> List[str]:
+        """수집 결과 일괄 저장 → 입력 순서대로 저장 상태 (columns 는 save_many_to_database 참고)"""
+        if self.portrait_store:
+            self.portrait_store.store_portraits([
+                info for info, info_columns in zip(artist_infos, columns or [None] * len(artist_infos))
+                if info_columns is None or 'images' in info_columns
+            ])
+        if self.ndjson_writer:
+            return ['written' if self.ndjson_writer.write(info) else 'failed' for info in artist_infos]
+        return self.save_many_to_database(artist_infos, columns)
+    
+    def _collect_and_save(self, name: str):
+        """단일 아티스트 수집 및 저장 → (ArtistInfo 또는 None, 오류 메시지)"""
+        artist_info = self.search_artist(name)
+        if not artist_info:
+            return None, 'Artist not found or not valid'
+        if not self.persist(artist_info):
+            return None, 'Database save failed'
+        return artist_info, None
+
+class ArtistWorkQueue:
+    """
+    Postgres 기반 분산 수집 대기열 (artist_collection_queue)
+
+    여러 워커가 SELECT ... FOR UPDATE SKIP LOCKED 로 중복 없이 작업을 가져가고,
+    처리 중인 작업은 하트비트로 리스를 연장한다. 실패한 작업은 지수 백오프 후 재시도하며
+    max_attempts 를 넘으면 'failed' 로 남긴다.
+    (스키마: migrations/create-artist-collection-logs-table.sql, add-artist-collection-queue-leases.sql)
+    """
+
+    def __init__(self, db_config: Dict[str, Any], worker_id: Optional[str] = None,
+                 lease_seconds: int = 300, retry_backoff: int = 60):
+        self.db_config = db_config
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.lease_seconds = lease_seconds
+        self.retry_backoff = retry_backoff
+        self._conn = None
+        self._lock = threading.Lock()
+        self._active_ids = set()
+        self._heartbeat_stop = threading.Event()
+        self._heartbeat_thread = None
+
+    def _execute(self, query: str, params: tuple = (), fetch: bool = False):
+        """공유 커넥션에서 쿼리 실행 후 커밋 (하트비트 스레드와 직렬화)"""
+        with self._lock:
+            if self._conn is None or self._conn.closed:
+                self._conn = connect_database(self.db_config)
+            try:
+                with self._conn.cursor() as cursor:
+                    cursor.execute(query, params)
+                    rows = cursor.fetchall() if fetch else None
+                self._conn.commit()
+                return rows
+            except Exception:
+                self._conn.rollback()
+                raise
+
+    def enqueue(self, artist_names: List[str], priority: int = 5,
+                request_reason: str = 'batch_import') -> int:
+        """대기열에 아티스트 일괄 추가 (이미 대기/처리 중이거나 목록 안에서 중복된 이름은 건너뜀)"""
+        # 기존 행과 같은 규칙: 악센트 제거, 구두점 삭제 ('Georgia O'Keeffe' → 'georgia okeefe')
+        names = {}
+        for name in artist_names:
+            key = ArtistNameResolver.normalize(name, punctuation='')
+            if key:
+                names.setdefault(key, name.strip())
+        if not names:
+            return 0
+        
+        # 한 번의 INSERT ... SELECT FROM unnest 로 전체 목록 추가 (이름당 왕복/커밋 없음)
+        rows = self._execute("""
+            INSERT INTO artist_collection_queue (artist_name, normalized_name, priority, request_reason, preferred_method)
+            SELECT n.artist_name, n.normalized_name, %s, %s, 'python'
+            FROM unnest(%s::text[], %s::text[]) AS n(artist_name, normalized_name)
+            WHERE NOT EXISTS (
+                SELECT 1 FROM artist_collection_queue q
+                WHERE q.normalized_name = n.normalized_name AND q.status IN ('pending', 'processing')
+            )
+            RETURNING id
+        """, (priority, request_reason, list(names.values()), list(names.keys())), fetch=True)
+        return len(rows)
+
+    def claim(self, limit: int) -> List[Dict[str, Any]]:
+        """처리할 작업을 최대 limit 개 가져옴 (리스가 만료된 작업 포함)"""
+        # 재시도 횟수를 다 쓴 채 리스가 만료된 작업은 실패 처리
+        self._execute("""
+            UPDATE artist_collection_queue
+            SET status = 'failed', error_message = COALESCE(error_message, 'lease expired'),
+                lease_expires_at = NULL, assigned_to = NULL
+            WHERE status = 'processing' AND lease_expires_at < CURRENT_TIMESTAMP
+              AND attempts >= max_attempts
+        """)
+
+        items = self._execute("""
+            UPDATE artist_collection_queue q
+            SET status = 'processing',
+                assigned_to = %s,
+                started_at = CURRENT_TIMESTAMP,
+                heartbeat_at = CURRENT_TIMESTAMP,
+                lease_expires_at = CURRENT_TIMESTAMP + make_interval(secs => %s),
+                attempts = q.attempts + 1
+            WHERE q.id IN (
+                SELECT id FROM artist_collection_queue
+                WHERE attempts < max_attempts
+                  AND expires_at > CURRENT_TIMESTAMP
+                  AND ((status = 'pending' AND scheduled_for <= CURRENT_TIMESTAMP)
+                       OR (status = 'processing' AND lease_expires_at < CURRENT_TIMESTAMP))
+                ORDER BY priority ASC, created_at ASC
+                LIMIT %s
+                FOR UPDATE SKIP LOCKED
+            )
+            RETURNING q.id, q.artist_name, q.attempts, q.max_attempts
+        """, (self.worker_id, self.lease_seconds, limit), fetch=True)
+
+        with self._lock:
+            self._active_ids.update(item['id'] for item in items)
+        return items
+
+    def heartbeat(self) -> int:
+        """처리 중인 작업의 리스 연장"""
+        with self._lock:
+            active_ids = list(self._active_ids)
+        if not active_ids:
+            return 0
+        rows = self._execute("""
+            UPDATE artist_collection_queue
+            SET heartbeat_at = CURRENT_TIMESTAMP,
+                lease_expires_at = CURRENT_TIMESTAMP + make_interval(secs => %s)
+            WHERE id = ANY(%s::uuid[]) AND assigned_to = %s AND status = 'processing'
+            RETURNING id
+        """, (self.lease_seconds, active_ids, self.worker_id), fetch=True)
+        return len(rows)
+
+    def complete(self, item_id, artist_name: Optional[str] = None):
+        """작업 완료 처리 (저장된 artists 행을 result_artist_id 로 연결)"""
+        self._release(item_id)
+        self._execute("""
+            UPDATE artist_collection_queue
+            SET status = 'completed', completed_at = CURRENT_TIMESTAMP,
+                lease_expires_at = NULL, error_message = NULL,
+                result_artist_id = (SELECT id FROM artists WHERE LOWER(name) = LOWER(%s) LIMIT 1)
+            WHERE id = %s AND assigned_to = %s
+        """, (artist_name, item_id, self.worker_id))
+
+    def fail(self, item_id, error: str) -> str:
+        """작업 실패 처리 → 백오프 후 재시도('pending') 또는 'failed'"""
+        self._release(item_id)
+        rows = self._execute("""
+            UPDATE artist_collection_queue
+            SET status = CASE WHEN attempts >= max_attempts THEN 'failed' ELSE 'pending' END,
+                scheduled_for = CURRENT_TIMESTAMP
+                    + make_interval(secs => LEAST(3600, %s * power(2, GREATEST(attempts - 1, 0)))),
+                lease_expires_at = NULL,
+                assigned_to = NULL,
+                error_message = %s
+            WHERE id = %s AND assigned_to = %s
+            RETURNING status
+        """, (self.retry_backoff, error, item_id, self.worker_id), fetch=True)
+        return rows[0]['status'] if rows else 'lost'
+
+    def has_remaining_work(self) -> bool:
+        """아직 끝나지 않은 작업(대기, 백오프, 다른 워커가 처리 중) 존재 여부"""
+        rows = self._execute("""
+            SELECT EXISTS (
+                SELECT 1 FROM artist_collection_queue
+                WHERE status IN ('pending', 'processing')
+                  AND attempts < max_attempts
+                  AND expires_at > CURRENT_TIMESTAMP
+            ) AS remaining
+        """, fetch=True)
+        return rows[0]['remaining']
+
+    def _release(self, item_id):
+        with self._lock:
+            self._active_ids.discard(item_id)
+
+    def start_heartbeat(self):
+        """리스 기간의 1/3 간격으로 하트비트 전송"""
+        def beat():
+            while not self._heartbeat_stop.wait(max(1, self.lease_seconds / 3)):
+                try:
+                    self.heartbeat()
+                except Exception as e:
+                    logger.warning(f"하트비트 실패: {e}")
+
+        self._heartbeat_stop.clear()
+        self._heartbeat_thread = threading.Thread(target=beat, name='queue-heartbeat', daemon=True)
+        self._heartbeat_thread.start()
+
+    def close(self):
+        self._heartbeat_stop.set()
+        if self._heartbeat_thread:
+            self._heartbeat_thread.join()
+        with self._lock:
+            if self._conn is not None and not self._conn.closed:
+                self._conn.close()
 
 def main():
     """메인 실행 함수"""
     parser = argparse.ArgumentParser(description='SAYU Wikipedia 아티스트 정보 수집기')
     parser.add_argument('--artist', '-a', help='단일 아티스트 이름')
     parser.add_argument('--batch', '-b', help='아티스트 목록 파일 경로')
+    parser.add_argument('--backfill', action='store_true', help='DB에서 비어 있는 필드가 있는 아티스트를 찾아 보충 수집')
+    parser.add_argument('--backfill-limit', type=int, help='백필할 최대 아티스트 수')
+    parser.add_argument('--recompute-classification', action='store_true',
+                        help='artists 전체의 copyright_status (와 생존 작가 era) 재계산 (Wikipedia 요청 없음)')
+    parser.add_argument('--dry-run', action='store_true', help='--recompute-classification 변경 건수만 보고 (UPDATE 없음)')
     parser.add_argument('--output', '-o', help='결과 저장 파일 (JSON)', default='artist_results.json')
+    parser.add_argument('--max-concurrency', type=int, default=8,
+                        help='호스트별 최대 동시 요청 수 (배치 모드에서 자동 조정되는 상한)')
+    parser.add_argument('--no-db', action='store_true', help='DB에 저장하지 않고 NDJSON 파일로 기록')
+    parser.add_argument('--ndjson', default='artist_results.ndjson', help='--no-db 결과 파일 (NDJSON)')
+    parser.add_argument('--download-portraits', metavar='DIR', help='초상화를 내려받을 로컬 저장소 디렉토리')
+    parser.add_argument('--portrait-workers', type=int, default=4, help='초상화 동시 다운로드 수')
+    parser.add_argument('--resolver-cache', default='resolved_titles.json',
+                        help='이름 → 문서 제목 해석 결과 캐시 (JSON)')
+    parser.add_argument('--redirect-dump', help='로컬 해석기에 추가할 리다이렉트 덤프 ("별칭\\t제목" 줄)')
+    parser.add_argument('--resolver-threshold', type=float, default=0.8,
+                        help='로컬 해석 결과를 믿을 최소 유사도 (미만이면 네트워크 검색)')
+    parser.add_argument('--time-budget', type=float, help='실행 시간 예산(초), 소진 시 새 작업을 멈추고 보류')
+    parser.add_argument('--request-budget', type=int, help='HTTP 요청 수 예산, 소진 시 새 작업을 멈추고 보류')
+    parser.add_argument('--priority-weights',
+                        help='스케줄러 가중치 (기본값: missing=1,featured=10,staleness=0.005,cost=1)')
+    parser.add_argument('--enqueue', help='아티스트 목록 파일을 Postgres 수집 대기열에 추가')
+    parser.add_argument('--worker', action='store_true', help='Postgres 수집 대기열 워커로 실행')
+    parser.add_argument('--worker-id', help='워커 식별자 (기본값: 호스트명:PID)')
+    parser.add_argument('--follow', action='store_true', help='대기열이 비어도 종료하지 않고 계속 대기')
+    parser.add_argument('--lease-seconds', type=int, default=300, help='작업 리스 기간(초), 하트비트로 연장')
+    parser.add_argument('--retry-backoff', type=int, default=60, help='재시도 기본 대기(초), 시도마다 2배')
     
     args = parser.parse_args()
     
-    collector = WikipediaArtistCollector()
+    if args.no_db and (args.enqueue or args.worker):
+        parser.error('--enqueue/--worker 는 Postgres 대기열을 사용하므로 --no-db 와 함께 쓸 수 없습니다')
+    if args.no_db and args.backfill:
+        parser.error('--backfill 은 artists 테이블에서 대상을 읽고 갱신하므로 --no-db 와 함께 쓸 수 없습니다')
+    if args.no_db and args.recompute_classification:
+        parser.error('--recompute-classification 은 artists 테이블을 갱신하므로 --no-db 와 함께 쓸 수 없습니다')
+    
+    priority_weights = None
+    if args.priority_weights:
+        try:
+            priority_weights = {
+                key.strip(): float(value)
+                for key, value in (pair.split('=') for pair in args.priority_weights.split(','))
+            }
+        except ValueError:
+            parser.error('--priority-weights 형식: missing=1,featured=10,staleness=0.005,cost=1')
+        unknown = set(priority_weights) - set(BatchScheduler.DEFAULT_WEIGHTS)
+        if unknown:
+            parser.error(f"알 수 없는 가중치: {', '.join(sorted(unknown))}")
+    
+    configure_logging()
+    
+    ndjson_writer = NdjsonArtistWriter(args.ndjson) if args.no_db else None
+    resolver = ArtistNameResolver(threshold=args.resolver_threshold, cache_path=args.resolver_cache)
+    if args.redirect_dump:
+        logger.info(f"🔤 리다이렉트 덤프 로드: {resolver.load_redirect_dump(args.redirect_dump)}줄")
+    collector = WikipediaArtistCollector(
+        max_concurrency=max(1, args.max_concurrency),
+        ndjson_writer=ndjson_writer,
+        resolver=resolver
+    )
+    collector.priority_weights = priority_weights
+    if args.time_budget is not None or args.request_budget is not None:
+        collector.budget = RunBudget(
+            collector.concurrency, time_budget=args.time_budget, request_budget=args.request_budget
+        )
+    if args.download_portraits:
+        collector.portrait_store = PortraitStore(
+            args.download_portraits, collector.session, max_workers=max(1, args.portrait_workers)
+        )
     
     if args.artist:
         # 단일 아티스트 처리
         artist_info = collector.search_artist(args.artist)
         if artist_info:
-            if collector.save_to_database(artist_info):
+            if collector.persist(artist_info):
                 print(f"✅ '{args.artist}' 정보 수집 및 저장 완료")
             else:
                 print(f"❌ '{args.artist}' DB 저장 실패")
@@ -804,19 +2632,76 @@ def main():
                         } for item in results['successful']
                     ],
                     'failed': results['failed'],
+                    'deferred': results['deferred'],
                     'total': results['total'],
-                    'success_rate': f"{len(results['successful'])/results['total']*100:.1f}%"
+                    'success_rate': f"{len(results['successful'])/results['total']*100:.1f}%",
+                    'changes': results['changes'],
+                    'canonical': results['canonical'],
+                    'concurrency': results['concurrency'],
+                    'budget': results.get('budget')
                 }
                 json.dump(serializable_results, f, ensure_ascii=False, indent=2)
             
             print(f"📊 결과가 {args.output}에 저장되었습니다")
-            print(f"성공: {len(results['successful'])}, 실패: {len(results['failed'])}")
+            print(f"성공: {len(results['successful'])}, 실패: {len(results['failed'])}, 보류: {len(results['deferred'])}")
+            print(f"저장: {', '.join(f'{status} {count}' for status, count in results['changes'].items()) or '없음'}")
             
         except FileNotFoundError:
             print(f"❌ 파일을 찾을 수 없습니다: {args.batch}")
     
+    elif args.recompute_classification:
+        # 분류 일괄 재계산
+        summary = collector.recompute_classification(dry_run=args.dry_run)
+        print(f"🗂️ {'변경 예정' if args.dry_run else '변경'}: {summary['changed']}개 행")
+        for transition, count in summary['copyright_status'].items():
+            print(f"  copyright_status {transition}: {count}")
+        for transition, count in summary['era'].items():
+            print(f"  era {transition}: {count}")
+    
+    elif args.backfill:
+        # DB 기반 백필
+        summary = collector.process_backfill(limit=args.backfill_limit)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+        
+        print(f"📊 결과가 {args.output}에 저장되었습니다")
+        print(f"백필 {summary['total']}명 - 성공: {summary['successful']}, 실패: {summary['failed']}, 보류: {summary['deferred']}")
+    
+    elif args.enqueue:
+        # 대기열에 추가
+        try:
+            with open(args.enqueue, 'r', encoding='utf-8') as f:
+                artist_names = [line.strip() for line in f if line.strip()]
+            
+            queue = ArtistWorkQueue(collector.db_config)
+            added = queue.enqueue(artist_names)
+            queue.close()
+            print(f"📥 대기열 추가: {added}명 (중복 {len(artist_names) - added}명 제외)")
+            
+        except FileNotFoundError:
+            print(f"❌ 파일을 찾을 수 없습니다: {args.enqueue}")
+    
+    elif args.worker:
+        # 대기열 워커
+        queue = ArtistWorkQueue(
+            collector.db_config,
+            worker_id=args.worker_id,
+            lease_seconds=args.lease_seconds,
+            retry_backoff=args.retry_backoff
+        )
+        stats = collector.run_queue_worker(queue, follow=args.follow)
+        print(f"🧵 워커 {stats['worker_id']} 종료 - 완료: {stats['completed']}, 재시도: {stats['retried']}, 실패: {stats['failed']}")
+    
     else:
         parser.print_help()
+    
+    resolver.save_cache()
+    if collector.portrait_store:
+        collector.portrait_store.save_manifest()
+    
+    if ndjson_writer:
+        ndjson_writer.close()
+        print(f"📝 수집 결과가 {args.ndjson}에 기록되었습니다")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,779 @@
+"""
+wikipediaArtistCollector.py 테스트
+
+python -m pytest backend/tests/test_wikipediaArtistCollector.py
+
+분류 재계산 SQL은 sqlite 로 실행해 Python 규칙과 비교한다 (Postgres 불필요).
+일괄 저장은 가짜 커넥션/커서로 커밋된 UPDATE/INSERT 파라미터를 확인한다.
+
+Postgres 대기열 테스트는 로컬 Postgres가 있을 때만 실행된다 (psycopg2 필요):
+WIKI_COLLECTOR_PG_TEST=1 DB_HOST=localhost DB_NAME=sayu_test DB_USER=postgres \\
+    python -m pytest backend/tests/test_wikipediaArtistCollector.py -k queue
+"""
+
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import sqlite3
+import sys
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'services'))
+
+import wikipediaArtistCollector  # noqa: E402
+from wikipediaArtistCollector import (  # noqa: E402
+    ArtistInfo,
+    ArtistNameResolver,
+    ArtistWorkQueue,
+    BatchScheduler,
+    HostConcurrencyLimit,
+    PortraitStore,
+    RunBudget,
+    WikipediaArtistCollector,
+    connect_database,
+    parse_retry_after,
+)
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(__file__), '..', 'migrations')
+
+# ---------------------------------------------------------------------------
+# 호스트별 동시성 한도 (AIMD + 지연시간 기울기)
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(wikipediaArtistCollector.time, 'monotonic', lambda: clock[0])
+    return clock
+
+
+def simulate_saturated_host(limit, clock, latency_for, responses):
+    """한도만큼 요청을 계속 채우며 응답 순서대로 release (가짜 시계 기준)"""
+    in_progress = []
+    sequence = 0
+    for _ in range(responses):
+        while limit.in_flight < int(limit.limit):
+            limit.acquire()
+            latency = latency_for(sequence)
+            in_progress.append((clock[0] + latency, sequence, latency))
+            sequence += 1
+        in_progress.sort()
+        finished_at, _, latency = in_progress.pop(0)
+        clock[0] = finished_at
+        limit.release(latency, 200)
+
+
+def test_concurrency_limit_grows_to_maximum_when_saturated(fake_clock):
+    limit = HostConcurrencyLimit('en.wikipedia.org', initial=2, maximum=8)
+    simulate_saturated_host(limit, fake_clock, lambda _: 0.1, 300)
+    assert limit.limit == 8
+    assert limit.snapshot()['peak_limit'] == 8
+
+
+def test_concurrency_limit_does_not_grow_while_idle(fake_clock):
+    limit = HostConcurrencyLimit('en.wikipedia.org', initial=4, maximum=8)
+    for _ in range(50):
+        limit.acquire()
+        fake_clock[0] += 0.1
+        limit.release(0.1, 200)
+    assert limit.limit == 4
+
+
+def test_concurrency_limit_converges_with_mixed_endpoint_latencies(fake_clock):
+    # 빠른 응답 하나(REST 404 등) 뒤에 50/150ms 가 섞여도 기준치가 고정되지 않음
+    latencies = lambda sequence: 0.02 if sequence == 0 else (0.05 if sequence % 2 else 0.15)
+    limit = HostConcurrencyLimit('en.wikipedia.org', initial=2, maximum=8)
+    simulate_saturated_host(limit, fake_clock, latencies, 300)
+    assert limit.limit == 8
+
+
+def test_concurrency_limit_backs_off_on_latency_spike(fake_clock):
+    latencies = lambda sequence: 0.1 if sequence < 400 else 0.6
+    limit = HostConcurrencyLimit('en.wikipedia.org', initial=2, maximum=8)
+    simulate_saturated_host(limit, fake_clock, latencies, 430)
+    assert limit.limit < 8 * 0.9
+
+
+def test_concurrency_limit_halves_on_throttle_and_honours_retry_after(fake_clock):
+    limit = HostConcurrencyLimit('en.wikipedia.org', initial=8, maximum=8)
+    limit.acquire()
+    limit.acquire()
+    limit.release(0.1, 429, retry_after=30)
+    assert limit.limit == 4
+    assert limit.blocked_until == fake_clock[0] + 30
+
+    # 같은 RTT 안의 두 번째 신호는 다시 줄이지 않음
+    limit.release(0.1, 503)
+    assert limit.limit == 4
+    assert limit.snapshot()['throttled'] == 2
+    assert limit.snapshot()['retry_after_waits'] == 1
+
+    # 다음 RTT 이후의 네트워크 오류는 한 단계(0.75) 감소, 최소 한도 아래로는 내려가지 않음
+    for _ in range(10):
+        fake_clock[0] += 5
+        limit.in_flight += 1
+        limit.release(0.1, None)
+    assert limit.limit == 1
+
+
+def test_parse_retry_after_accepts_seconds_and_http_dates(fake_clock):
+    assert parse_retry_after('120') == 120.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after('soon') is None
+    assert parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0.0
+
+
+# ---------------------------------------------------------------------------
+# 초상화 저장소 매니페스트
+# ---------------------------------------------------------------------------
+
+
+def test_portrait_manifest_appends_log_and_compacts_on_save(tmp_path, monkeypatch):
+    def fake_download(self, url, part_path, resume=True):
+        with open(part_path, 'wb') as f:
+            f.write(url.encode('utf-8'))
+        return 'image/png'
+
+    monkeypatch.setattr(PortraitStore, '_download', fake_download)
+    root = str(tmp_path)
+    store = PortraitStore(root, session=None, max_workers=2)
+    for i in range(3):
+        assert store.store_portraits([ArtistInfo(name=f'Artist {i}', image_url=f'https://example.org/{i}.png')]) == 1
+
+    # 호출마다 manifest.json 을 다시 쓰지 않고 새 매핑만 로그에 덧붙임
+    assert not os.path.exists(os.path.join(root, 'manifest.json'))
+    with open(os.path.join(root, 'manifest.log'), 'a', encoding='utf-8') as f:
+        f.write('{"url": "https://example.org/trunc')  # 중단된 실행의 잘린 줄
+
+    reopened = PortraitStore(root, session=None)
+    assert reopened.manifest == store.manifest
+    assert len(reopened.manifest) == 3
+
+    reopened.save_manifest()
+    assert not os.path.exists(os.path.join(root, 'manifest.log'))
+    with open(os.path.join(root, 'manifest.json'), encoding='utf-8') as f:
+        assert json.load(f) == store.manifest
+
+
+# ---------------------------------------------------------------------------
+# 이름 해석 (로컬 트라이그램 색인)
+# ---------------------------------------------------------------------------
+
+RESOLVER_TEST_SYLLABLES = ['an', 'el', 'ri', 'so', 'ta', 'lu', 'ne', 'ko', 'mi', 'ra']
+
+
+def resolver_test_names(rng, count):
+    word = lambda: ''.join(rng.choice(RESOLVER_TEST_SYLLABLES) for _ in range(rng.randint(1, 4)))
+    return list(dict.fromkeys(f"{word()} {word()}" for _ in range(count)))
+
+
+def indexed_grams(resolver, names):
+    return [resolver.trigrams(resolver.normalize(name)) for name in names]
+
+
+def brute_force_score(resolver, candidates, name, threshold):
+    """후보 트라이그램 집합 전체의 Dice 계수를 직접 계산한 최고 점수 (threshold 미만이면 None)"""
+    grams = resolver.trigrams(resolver.normalize(name))
+    best = max((2 * len(grams & other) / (len(grams) + len(other)) for other in candidates), default=0)
+    return best if best >= threshold else None
+
+
+def typo(rng, name):
+    position = rng.randrange(len(name))
+    return name[:position] + rng.choice('aeiklnorstuz') + name[position + 1:]
+
+
+@pytest.mark.parametrize('scan_budget', [ArtistNameResolver.SCAN_BUDGET, 20])
+def test_resolver_lookup_matches_brute_force(monkeypatch, scan_budget):
+    rng = random.Random(7)
+    resolver = ArtistNameResolver()
+    monkeypatch.setattr(resolver, 'SCAN_BUDGET', scan_budget)
+    names = resolver_test_names(rng, 3000)
+    for name in names:
+        resolver.add(name, name)
+    candidates = indexed_grams(resolver, names)
+
+    for threshold in (0.5, 0.6, 0.7, 0.8, 0.9):
+        for _ in range(40):
+            query = typo(rng, rng.choice(names))
+            found = resolver.lookup(query, min_score=threshold)
+            expected = brute_force_score(resolver, candidates, query, threshold)
+            assert (found and round(found[1], 9)) == (expected and round(expected, 9)), (query, threshold)
+
+
+def test_resolver_lookup_during_concurrent_add():
+    rng = random.Random(11)
+    resolver = ArtistNameResolver()
+    names = resolver_test_names(rng, 4000)
+    base, added = names[:1500], names[1500:]
+    for name in base:
+        resolver.add(name, name)
+    base_candidates = indexed_grams(resolver, base)
+    queries = [(typo(rng, rng.choice(base)), rng.choice((0.5, 0.7, 0.9))) for _ in range(150)]
+
+    errors = []
+
+    def writer():
+        try:
+            for name in added:
+                resolver.add(name, name)
+        except Exception as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    results = [(query, threshold, resolver.lookup(query, min_score=threshold)) for query, threshold in queries]
+    thread.join()
+    assert errors == []
+
+    for query, threshold, found in results:
+        # 추가 중인 항목은 보일 수도 안 보일 수도 있지만, 처음부터 있던 항목보다 나쁜 결과는 없음
+        expected = brute_force_score(resolver, base_candidates, query, threshold)
+        if expected is not None:
+            assert found is not None and found[1] >= expected - 1e-9, (query, threshold)
+        if found is not None:
+            assert round(found[1], 9) == round(brute_force_score(resolver, indexed_grams(resolver, [found[0]]), query, 0), 9)
+    for name in added:
+        assert resolver.lookup(name) == (name, 1.0)
+
+
+class FakeWikipedia:
+    def __init__(self, titles):
+        self.titles = titles
+
+    def page(self, title):
+        return type('FakePage', (), {'title': title, 'exists': lambda page: title in self.titles})()
+
+
+def test_search_artist_searches_when_locally_resolved_page_is_not_an_artist(monkeypatch):
+    collector = WikipediaArtistCollector()
+    searches = []
+    monkeypatch.setattr(collector, '_wikis', {'en': FakeWikipedia({'Monet (film)', 'Claude Monet', 'Monet'})})
+    monkeypatch.setattr(collector, 'resolve_locally', lambda name: 'Monet (film)')
+    monkeypatch.setattr(collector, 'search_variations',
+                        lambda name: searches.append(name) or ['Monet (film)', 'Claude Monet'])
+    monkeypatch.setattr(collector, '_collect_page', lambda name, page, missing: (
+        ArtistInfo(name=page.title) if page.title == 'Claude Monet' else None
+    ))
+
+    # 로컬 해석 결과가 아티스트 문서가 아니면 검색 변형으로 넘어가고, 확인된 결과만 학습
+    assert collector.search_artist('Claud Monett').name == 'Claude Monet'
+    assert collector.resolver._learned == {'Claud Monett': 'Claude Monet'}
+
+    # 입력 이름 그대로의 문서가 아티스트가 아니면 검색하지 않음
+    assert collector.search_artist('Monet') is None
+    assert searches == ['Claud Monett']
+
+
+def test_group_by_canonical_defers_learning_redirect_aliases(monkeypatch):
+    collector = WikipediaArtistCollector()
+    response = type('FakeResponse', (), {'status_code': 200, 'json': lambda self: {'query': {
+        'redirects': [{'from': 'Picaso', 'to': 'Pablo Picasso'}],
+        'pages': [{'pageid': 24176, 'title': 'Pablo Picasso'}]
+    }}})()
+    monkeypatch.setattr(collector.session, 'get', lambda url, params=None: response)
+
+    groups = collector.group_by_canonical(['Picaso', 'Pablo Picasso'])
+
+    assert groups == [{'title': 'Pablo Picasso', 'names': ['Picaso', 'Pablo Picasso'],
+                       'resolved': True, 'aliases': ['Picaso']}]
+    # 문서가 아티스트로 확인되기 전에는 해석 캐시에 기록하지 않음 (process_batch 에서 수집 성공 후 기록)
+    assert collector.resolver._learned == {}
+
+
+# ---------------------------------------------------------------------------
+# 일괄 저장 (가짜 커서)
+# ---------------------------------------------------------------------------
+
+UPDATE_PARAM_INDEX = {
+    column: index for index, column in enumerate((
+        'name_ko', 'birth_year', 'death_year', 'nationality', 'nationality_ko', 'bio', 'bio_ko',
+        'era', 'stale_image_keys', 'images', 'sources', 'official_links', 'id'
+    ))
+}
+
+
+class FakeArtistsDatabase:
+    """save_many_to_database 가 쓰는 쿼리만 흉내 (커밋된 UPDATE/INSERT 파라미터 기록)"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.connections = 0
+        self.updates = []
+        self.inserts = []
+
+    def connect(self, db_config):
+        self.connections += 1
+        return FakeConnection(self)
+
+
+class FakeConnection:
+    def __init__(self, database):
+        self.database = database
+        self.closed = False
+        self.pending = []
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        for kind, params in self.pending:
+            getattr(self.database, kind).append(params)
+        self.pending = []
+
+    def close(self):
+        self.closed = True
+
+
+class FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+        self.result = []
+
+    def execute(self, query, params=()):
+        statement = query.split()[0].upper()
+        if statement == 'SELECT':
+            keys = params[0]
+            self.result = [dict(row, name_key=name.lower())
+                           for name, row in self.connection.database.rows.items() if name.lower() in keys]
+            return
+        if 'BAD' in params:
+            raise ValueError('invalid input value')
+        kind = 'updates' if statement == 'UPDATE' else 'inserts'
+        self.connection.pending.append((kind, params))
+
+    def fetchall(self):
+        return self.result
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def fake_artists_database(monkeypatch):
+    database = FakeArtistsDatabase({})
+    extras = type(sys)('psycopg2.extras')
+    extras.execute_batch = lambda cursor, query, rows: [cursor.execute(query, row) for row in rows]
+    psycopg2 = type(sys)('psycopg2')
+    psycopg2.extras = extras
+    monkeypatch.setitem(sys.modules, 'psycopg2', psycopg2)
+    monkeypatch.setitem(sys.modules, 'psycopg2.extras', extras)
+    monkeypatch.setattr(wikipediaArtistCollector, 'connect_database', database.connect)
+    return database
+
+
+def stored_row(collector, artist_info, row_id):
+    """artist_info 를 그대로 저장했을 때의 artists 행 (JSONB 는 dict 로 읽힘)"""
+    row = collector.persisted_values(artist_info)
+    row['id'] = row_id
+    return row
+
+
+def test_save_many_skips_unchanged_and_updates_changed_rows(fake_artists_database):
+    collector = WikipediaArtistCollector()
+    unchanged = ArtistInfo(name='Claude Monet', birth_year=1840, death_year=1926,
+                           biography='French painter', wikipedia_url='https://en.wikipedia.org/wiki/Claude_Monet')
+    changed = ArtistInfo(name='Frida Kahlo', birth_year=1907, death_year=1954, biography='Mexican painter')
+    fake_artists_database.rows = {
+        'Claude Monet': stored_row(collector, unchanged, 1),
+        'Frida Kahlo': dict(stored_row(collector, changed, 2), bio='old bio'),
+    }
+    new = ArtistInfo(name='Yayoi Kusama', birth_year=1929)
+
+    statuses = collector.save_many_to_database([unchanged, changed, new, ArtistInfo(name='claude monet')])
+
+    assert statuses == ['unchanged', 'updated', 'inserted', 'unchanged']
+    assert [update[UPDATE_PARAM_INDEX['id']] for update in fake_artists_database.updates] == [2]
+    assert fake_artists_database.updates[0][UPDATE_PARAM_INDEX['bio']] == 'Mexican painter'
+    assert [insert[0] for insert in fake_artists_database.inserts] == ['Yayoi Kusama']
+    assert fake_artists_database.connections == 1
+
+
+def test_save_many_retries_rows_individually_after_batch_failure(fake_artists_database):
+    collector = WikipediaArtistCollector()
+    infos = [
+        ArtistInfo(name='Andy Warhol', birth_year=1928, death_year=1987),
+        ArtistInfo(name='Broken Artist', name_ko='BAD'),
+        ArtistInfo(name='Henri Matisse', birth_year=1869, death_year=1954),
+    ]
+
+    statuses = collector.save_many_to_database(infos)
+
+    # 배치는 커밋되지 않고, 행 단위 재시도에서 문제가 된 행만 실패
+    assert statuses == ['inserted', 'failed', 'inserted']
+    assert [insert[0] for insert in fake_artists_database.inserts] == ['Andy Warhol', 'Henri Matisse']
+    assert fake_artists_database.connections == 1 + len(infos)
+
+
+def test_save_many_backfill_writes_only_missing_columns(fake_artists_database):
+    collector = WikipediaArtistCollector()
+    info = ArtistInfo(name='Banksy', name_ko='뱅크시', nationality='British', biography='Street artist',
+                      wikidata_id='Q133600')
+    fake_artists_database.rows = {
+        'Banksy': dict(stored_row(collector, ArtistInfo(name='Banksy', biography='Curated bio'), 7),
+                       name_ko=None, nationality=None),
+    }
+
+    statuses = collector.save_many_to_database([info], [{'name_ko', 'nationality'}])
+
+    assert statuses == ['updated']
+    update = fake_artists_database.updates[0]
+    assert update[UPDATE_PARAM_INDEX['name_ko']] == '뱅크시'
+    assert update[UPDATE_PARAM_INDEX['nationality']] == 'British'
+    # 비어 있지 않던 컬럼은 COALESCE(NULL, 기존값) 으로 유지
+    for column in ('birth_year', 'death_year', 'nationality_ko', 'bio', 'bio_ko', 'era',
+                   'images', 'sources', 'official_links'):
+        assert update[UPDATE_PARAM_INDEX[column]] is None
+
+
+def test_save_many_merges_images_and_drops_stale_portrait_keys(fake_artists_database):
+    collector = WikipediaArtistCollector()
+    current = ArtistInfo(name='Pablo Picasso', birth_year=1881, death_year=1973,
+                         image_url='https://upload.wikimedia.org/old.jpg', image_key='abc123',
+                         image_variants={'thumb': 'portraits/abc123/thumb.webp'})
+    fake_artists_database.rows = {'Pablo Picasso': stored_row(collector, current, 3)}
+
+    # --download-portraits 없이 같은 초상화를 다시 수집하면 저장소 키가 유지되어 변경 없음
+    same_portrait = ArtistInfo(name='Pablo Picasso', birth_year=1881, death_year=1973,
+                               image_url='https://upload.wikimedia.org/old.jpg')
+    assert collector.save_many_to_database([same_portrait]) == ['unchanged']
+
+    # 초상화 URL 이 바뀌면 이전 저장소 키를 제거
+    new_portrait = ArtistInfo(name='Pablo Picasso', birth_year=1881, death_year=1973,
+                              image_url='https://upload.wikimedia.org/new.jpg')
+    assert collector.save_many_to_database([new_portrait]) == ['updated']
+    update = fake_artists_database.updates[0]
+    assert update[UPDATE_PARAM_INDEX['stale_image_keys']] == ['portrait_key', 'portrait_variants']
+    assert json.loads(update[UPDATE_PARAM_INDEX['images']]) == {'portrait': 'https://upload.wikimedia.org/new.jpg'}
+
+
+# ---------------------------------------------------------------------------
+# 분류 재계산 (SQL ↔ Python 규칙 일치)
+# ---------------------------------------------------------------------------
+
+CLASSIFICATION_YEARS = [None, 0, 1300, 1399, 1400, 1599, 1600, 1749, 1750, 1849, 1850, 1870,
+                        1899, 1900, 1944, 1945, 1955, 1956, 1975, 1976, 1979, 1980, 2000, 2020]
+CLASSIFICATION_ERAS = [None, 'Impressionism', 'Modern', 'Contemporary', 'Post-Impressionism', 'Cubism']
+CLASSIFICATION_STATUSES = [None, 'unknown', 'licensed', 'public_domain', 'verified_artist', 'estate_managed']
+CURRENT_YEARS = [2025, 2026, 2045, 2046, 2130]
+
+
+def run_classification_sql(collector, rows, current_year):
+    """recompute_classification 의 새 값 식을 sqlite 로 계산 → {id: (era, copyright_status)}"""
+    conn = sqlite3.connect(':memory:')
+    conn.execute(
+        "CREATE TABLE artists (id INTEGER, birth_year INTEGER, death_year INTEGER, era TEXT, copyright_status TEXT)"
+    )
+    conn.executemany("INSERT INTO artists VALUES (?, ?, ?, ?, ?)", rows)
+    query = (
+        f"SELECT id, {collector.era_recompute_sql()} AS new_era, "
+        f"{collector.copyright_status_recompute_sql()} AS new_status FROM artists"
+    ).replace('%(current_year)s', ':current_year')
+    result = {row[0]: (row[1], row[2]) for row in conn.execute(query, {'current_year': current_year})}
+    conn.close()
+    return result
+
+
+def test_classification_sql_matches_python(monkeypatch):
+    collector = WikipediaArtistCollector()
+    vocabulary = {era for _, era in collector.ERA_BOUNDARIES} | {collector.DEFAULT_ERA}
+    rows = [
+        (index, birth_year, death_year, era, status)
+        for index, (birth_year, death_year, era, status) in enumerate(itertools.product(
+            CLASSIFICATION_YEARS, CLASSIFICATION_YEARS, CLASSIFICATION_ERAS, CLASSIFICATION_STATUSES
+        ))
+    ]
+
+    for current_year in CURRENT_YEARS:
+        class FixedDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return datetime(current_year, 1, 1)
+
+        monkeypatch.setattr(wikipediaArtistCollector, 'datetime', FixedDatetime)
+        computed = run_classification_sql(collector, rows, current_year)
+
+        for index, birth_year, death_year, era, status in rows:
+            # 수동 지정 상태는 유지, 비었거나 규칙 값이면 재계산
+            if status is None or status in collector.COPYRIGHT_STATUSES:
+                status = collector.determine_copyright_status(
+                    ArtistInfo(name='x', birth_year=birth_year, death_year=death_year)
+                )
+            # 올해에 따라 바뀌는 era 만, 그리고 수집기 분류 값이었던 era 만 재계산
+            if birth_year and not death_year and (era is None or era in vocabulary):
+                expected_era = collector.classify_era(birth_year, death_year)
+            else:
+                expected_era = era
+            assert computed[index] == (expected_era, status), (current_year, birth_year, death_year, era)
+
+
+def test_classification_recompute_keeps_curated_eras():
+    # migrations/create-artists-table.sql 시드 데이터
+    rows = [
+        (1, 1853, 1890, 'Post-Impressionism', 'public_domain'),  # Vincent van Gogh
+        (2, 1881, 1973, 'Cubism', 'licensed'),                   # Pablo Picasso
+        (3, 1907, 1954, 'Surrealism', 'licensed'),               # Frida Kahlo
+        (4, None, None, 'Modern', None),
+        (5, 1958, None, 'Postmodern', 'contemporary'),
+        (6, 1974, None, 'Contemporary', 'verified_artist'),      # Kaws
+        (7, 1900, 1980, 'Modern', 'estate_managed'),
+    ]
+    computed = run_classification_sql(WikipediaArtistCollector(), rows, 2026)
+
+    assert computed[1] == ('Post-Impressionism', 'public_domain')
+    assert computed[2] == ('Cubism', 'transitional')
+    assert computed[3] == ('Surrealism', 'public_domain')
+    assert computed[4] == ('Modern', 'unknown')
+    assert computed[5] == ('Contemporary', 'contemporary')
+    # 수동 지정 저작권 상태는 덮어쓰지 않음
+    assert computed[6] == ('Contemporary', 'verified_artist')
+    assert computed[7] == ('Modern', 'estate_managed')
+
+
+# ---------------------------------------------------------------------------
+# 배치 스케줄러 (실행 예산)
+# ---------------------------------------------------------------------------
+
+
+class FakeController:
+    """RunBudget 이 세는 실제 요청 수만 흉내"""
+
+    def __init__(self):
+        self.requests = 0
+
+    def total_requests(self):
+        return self.requests
+
+
+def scheduler_item(title, cost, featured=False):
+    return {'title': title, 'names': [title], 'missing_count': 4, 'featured': featured,
+            'staleness_days': 30, 'cost': cost}
+
+
+def test_scheduler_pops_by_priority_per_expected_request():
+    scheduler = BatchScheduler()
+    for item in (scheduler_item('cheap', 3), scheduler_item('expensive', 9), scheduler_item('featured', 9, featured=True)):
+        scheduler.push(item)
+    # (1 + 4 + 0.15) / 3 = 1.72, (1 + 4 + 10 + 0.15) / 9 = 1.68, (1 + 4 + 0.15) / 9 = 0.57
+    assert [scheduler.pop()['title'] for _ in range(3)] == ['cheap', 'featured', 'expensive']
+    assert scheduler.pop() is None
+
+
+def test_scheduler_waits_for_reserved_requests_before_deferring(fake_clock):
+    controller = FakeController()
+    scheduler = BatchScheduler(RunBudget(controller, request_budget=10))
+    scheduler.push(scheduler_item('featured', 4, featured=True))
+    scheduler.push(scheduler_item('cheap', 2))
+
+    # 진행 중 작업이 8개 요청을 예약 중이면 보류하지 않고 기다림
+    assert scheduler.pop(reserved_requests=8) is None
+    assert scheduler.deferred == []
+
+    # 진행 중 작업이 예상보다 적게 쓰고 끝나면 같은 작업을 다시 시도
+    controller.requests = 5
+    assert scheduler.pop()['title'] == 'featured'
+
+
+def test_scheduler_defers_unaffordable_item_and_continues_without_reservations(fake_clock):
+    controller = FakeController()
+    budget = RunBudget(controller, request_budget=10)
+    scheduler = BatchScheduler(budget)
+    scheduler.push(scheduler_item('featured', 4, featured=True))
+    scheduler.push(scheduler_item('cheap', 2))
+    controller.requests = 7
+
+    # 남은 예산(3)으로 못 하는 작업만 보류하고 더 싼 작업을 계속 찾음
+    assert scheduler.pop()['title'] == 'cheap'
+    assert [(item['title'], item['reason']) for item in scheduler.deferred] == [('featured', 'request_budget')]
+    assert scheduler.pop() is None
+
+
+def test_scheduler_defers_everything_when_time_budget_runs_out(fake_clock):
+    scheduler = BatchScheduler(RunBudget(FakeController(), time_budget=60))
+    for index in range(3):
+        scheduler.push(scheduler_item(f'artist {index}', 2))
+    assert scheduler.pop()['title'] == 'artist 0'
+
+    fake_clock[0] += 60
+    assert scheduler.pop(reserved_requests=2) is None
+    assert [(item['title'], item['reason']) for item in scheduler.deferred] == [
+        ('artist 1', 'time_budget'), ('artist 2', 'time_budget')
+    ]
+    assert scheduler.pop() is None
+
+
+# ---------------------------------------------------------------------------
+# Postgres 대기열 (여러 워커 프로세스)
+# ---------------------------------------------------------------------------
+
+QUEUE_TEST_SCHEMA = f"wiki_collector_test_{os.getpid()}"
+
+# create-artist-collection-logs-table.sql 의 artist_collection_queue 중 워커가 쓰는 컬럼
+# (users/artists 외래 키 없이 독립 스키마에 생성)
+QUEUE_TEST_TABLES = """
+CREATE TABLE artists (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    name VARCHAR(255) NOT NULL UNIQUE
+);
+CREATE TABLE artist_collection_queue (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    artist_name VARCHAR(255) NOT NULL,
+    normalized_name VARCHAR(255),
+    priority INTEGER DEFAULT 5,
+    status VARCHAR(50) DEFAULT 'pending',
+    preferred_method VARCHAR(50) DEFAULT 'enhanced',
+    request_reason VARCHAR(255),
+    assigned_to VARCHAR(100),
+    started_at TIMESTAMPTZ,
+    completed_at TIMESTAMPTZ,
+    attempts INTEGER DEFAULT 0,
+    max_attempts INTEGER DEFAULT 3,
+    result_artist_id UUID REFERENCES artists(id),
+    error_message TEXT,
+    scheduled_for TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
+    expires_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP + INTERVAL '7 days',
+    created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE collection_log (
+    artist_name VARCHAR(255) NOT NULL,
+    worker_id VARCHAR(100) NOT NULL
+);
+"""
+
+QUEUE_TEST_NAMES = [f"Queue Test Artist {i}" for i in range(60)]
+# 첫 시도에서 실패시켜 백오프 재시도를 확인할 이름
+QUEUE_TEST_FAIL_ONCE = set(QUEUE_TEST_NAMES[::10])
+
+
+def queue_test_db_config():
+    return {
+        'host': os.getenv('DB_HOST', 'localhost'),
+        'port': os.getenv('DB_PORT', 5432),
+        'database': os.getenv('DB_NAME', 'sayu'),
+        'user': os.getenv('DB_USER', 'postgres'),
+        'password': os.getenv('DB_PASSWORD', ''),
+        'options': f"-c search_path={QUEUE_TEST_SCHEMA}"
+    }
+
+
+class QueueTestCollector(WikipediaArtistCollector):
+    """Wikipedia 대신 테스트 스키마에 기록하는 수집기"""
+
+    def _collect_and_save(self, name: str):
+        conn = connect_database(self.db_config)
+        try:
+            cursor = conn.cursor()
+            cursor.execute(
+                "INSERT INTO collection_log (artist_name, worker_id) VALUES (%s, %s)",
+                (name, self.test_worker_id)
+            )
+            cursor.execute("SELECT COUNT(*) AS count FROM collection_log WHERE artist_name = %s", (name,))
+            attempts = cursor.fetchone()['count']
+            if name in QUEUE_TEST_FAIL_ONCE and attempts == 1:
+                conn.commit()
+                return None, 'first attempt fails'
+            cursor.execute(
+                "INSERT INTO artists (name) VALUES (%s) ON CONFLICT (name) DO NOTHING", (name,)
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        time.sleep(0.01)
+        return ArtistInfo(name=name), None
+
+
+def run_queue_test_worker(worker_id: str):
+    collector = QueueTestCollector(max_concurrency=4)
+    collector.db_config = queue_test_db_config()
+    collector.test_worker_id = worker_id
+    queue = ArtistWorkQueue(collector.db_config, worker_id=worker_id, lease_seconds=30, retry_backoff=0)
+    stats = collector.run_queue_worker(queue, batch_size=5, poll_interval=0.1)
+    return {key: stats[key] for key in ('worker_id', 'completed', 'retried', 'failed')}
+
+
+@pytest.fixture
+def queue_test_schema():
+    if not os.getenv('WIKI_COLLECTOR_PG_TEST'):
+        pytest.skip('WIKI_COLLECTOR_PG_TEST=1 과 로컬 Postgres 설정(DB_*)이 필요함')
+    pytest.importorskip('psycopg2')
+
+    admin_config = {key: value for key, value in queue_test_db_config().items() if key != 'options'}
+    conn = connect_database(admin_config)
+    conn.autocommit = True
+    cursor = conn.cursor()
+    cursor.execute(f"CREATE SCHEMA {QUEUE_TEST_SCHEMA}")
+    cursor.execute(f"SET search_path TO {QUEUE_TEST_SCHEMA}")
+    cursor.execute(QUEUE_TEST_TABLES)
+    with open(os.path.join(MIGRATIONS_DIR, 'add-artist-collection-queue-leases.sql'), encoding='utf-8') as f:
+        cursor.execute(f.read())
+    try:
+        yield
+    finally:
+        cursor.execute(f"DROP SCHEMA {QUEUE_TEST_SCHEMA} CASCADE")
+        conn.close()
+
+
+def test_enqueue_normalizes_names_like_seeded_rows(monkeypatch):
+    queue = ArtistWorkQueue({})
+    calls = []
+
+    def fake_execute(query, params=(), fetch=False):
+        calls.append(params)
+        return [{'id': i} for i in range(len(params[2]))]
+
+    monkeypatch.setattr(queue, '_execute', fake_execute)
+    added = queue.enqueue(['Salvador Dalí', "Georgia O'Keeffe", ' salvador  dali ', 'Jean-Michel Basquiat', '  '])
+
+    # create-artist-collection-logs-table.sql 초기 데이터와 같은 규칙 (악센트 제거, 구두점 삭제)
+    _, _, artist_names, normalized_names = calls[0]
+    assert normalized_names == ['salvador dali', 'georgia okeeffe', 'jeanmichel basquiat']
+    assert artist_names == ['Salvador Dalí', "Georgia O'Keeffe", 'Jean-Michel Basquiat']
+    assert added == 3
+
+
+def test_queue_workers_process_each_item_once(queue_test_schema):
+    db_config = queue_test_db_config()
+
+    queue = ArtistWorkQueue(db_config)
+    # 목록 안의 중복(대소문자/공백)과 이미 대기 중인 이름은 추가되지 않음
+    assert queue.enqueue(QUEUE_TEST_NAMES + [' queue test artist 0 ']) == len(QUEUE_TEST_NAMES)
+    assert queue.enqueue(QUEUE_TEST_NAMES[:5]) == 0
+    queue.close()
+
+    context = multiprocessing.get_context('fork')
+    with context.Pool(4) as pool:
+        stats = pool.map(run_queue_test_worker, [f"test-worker-{i}" for i in range(4)])
+
+    assert sum(worker['completed'] for worker in stats) == len(QUEUE_TEST_NAMES)
+    assert sum(worker['retried'] for worker in stats) == len(QUEUE_TEST_FAIL_ONCE)
+    assert sum(worker['failed'] for worker in stats) == 0
+    # 작업이 한 워커에 몰리지 않고 나뉘어 처리됨
+    assert sum(1 for worker in stats if worker['completed']) > 1
+
+    conn = connect_database(db_config)
+    cursor = conn.cursor()
+    cursor.execute("SELECT artist_name, COUNT(*) AS count FROM collection_log GROUP BY artist_name")
+    attempts = {row['artist_name']: row['count'] for row in cursor.fetchall()}
+    cursor.execute("""
+        SELECT q.artist_name, q.status, q.attempts, q.lease_expires_at, a.name AS result_name
+        FROM artist_collection_queue q
+        LEFT JOIN artists a ON a.id = q.result_artist_id
+    """)
+    items = cursor.fetchall()
+    conn.close()
+
+    # SKIP LOCKED: 실패 후 재시도한 이름만 두 번, 나머지는 정확히 한 번 처리
+    assert attempts == {name: 2 if name in QUEUE_TEST_FAIL_ONCE else 1 for name in QUEUE_TEST_NAMES}
+    assert len(items) == len(QUEUE_TEST_NAMES)
+    for item in items:
+        assert item['status'] == 'completed'
+        assert item['lease_expires_at'] is None
+        assert item['result_name'] == item['artist_name']
+        assert item['attempts'] == (2 if item['artist_name'] in QUEUE_TEST_FAIL_ONCE else 1)